@@ -1,79 +1,378 @@
-from flask import Flask, request, jsonify, send_file, send_from_directory
+from flask import Flask, Response, request, jsonify, send_file, send_from_directory
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
+from flask_compress import Compress
+from werkzeug.wsgi import wrap_file
 import os
+import sys
 import json
 from pathlib import Path
 import logging
+import time
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, suppress
 from datetime import datetime
+from functools import lru_cache
 import zipfile
 import tempfile
+import hashlib
+import hmac
+import re
+import orjson
+
+try:
+    import fcntl
+except ImportError:  # Windows: the dev server runs a single process anyway
+    fcntl = None
+
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+class ORJSONProvider(DefaultJSONProvider):
+    """Route jsonify/get_json through orjson"""
+    
+    def dumps(self, obj, **kwargs):
+        # Match DefaultJSONProvider: non-str keys are stringified, keys sorted unless disabled
+        option = orjson.OPT_NON_STR_KEYS
+        if kwargs.get('sort_keys', self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=kwargs.get('default', self.default), option=option).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
 
 app = Flask(__name__)
+app.json = ORJSONProvider(app)
 CORS(app)  # Enable CORS for external access
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+# Let a fronting server (nginx/Apache) stream downloads via X-Sendfile
+app.use_x_sendfile = os.environ.get('DATAFORGE_X_SENDFILE') == '1'
+app.config['USE_X_SENDFILE'] = app.use_x_sendfile
+
+# Compress JSON bodies only; level 1 favours throughput over ratio. File downloads
+# stay on the passthrough/sendfile path (a fronting nginx can gzip_static CSVs)
+app.config['COMPRESS_MIMETYPES'] = ['application/json']
+app.config['COMPRESS_ALGORITHM'] = ['gzip', 'deflate']
+app.config['COMPRESS_STREAMS'] = False
+app.config['COMPRESS_LEVEL'] = 1
+app.config['COMPRESS_DEFLATE_LEVEL'] = 1
+Compress(app)
+
 logger = logging.getLogger(__name__)
 
 # Configuration
 DATASETS_PATH = Path("data/generated_datasets")
+JOBS_PATH = Path("data/jobs")
+ZIP_CACHE_PATH = Path("data/zip_cache")
+ZIP_CACHE_MAX_AGE = 7 * 24 * 3600
+ZIP_CACHE_MAX_BYTES = 1024 ** 3
+ZIP_CACHE_PRUNE_INTERVAL = 3600
+JOBS_MAX_AGE = 24 * 3600
+GENERATION_LOCK_PATH = JOBS_PATH / ".generation.lock"
 API_KEY = "algonomy"
+_AUTH_HEADER = f"Bearer {API_KEY}".encode('latin-1')
+_HEALTH_PAYLOAD = {'status': 'healthy', 'version': '2.0.0'}
+
+# Path components accepted from URLs: no separators, and no dots in keywords
+_is_safe_keyword = re.compile(r'\A[\w\- ]{1,64}\Z').match
+_is_safe_filename = re.compile(r'\A[\w\-. ]{1,128}\Z').match
+HEALTH_CACHE_TTL = 1.0
+DOWNLOAD_BUFFER_SIZE = 1024 * 1024
+
+_datasets_count_cache = None
+_manifest_cache = None
+
+# Built on first use, so importing this module (e.g. from the GUI, or in the
+# gunicorn master before it forks) doesn't authenticate Kaggle or probe Ollama
+_generator = None
+_init_lock = threading.Lock()
+_zip_build_locks = {}
+_janitor_started = False
+
+# Generation runs off the request thread. Each worker process queues its own jobs,
+# and _generation_slot() makes workers take turns since they all share Ollama.
+# Executors only spawn their threads on first submit
+_job_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='dataforge-job')
+_scan_executor = ThreadPoolExecutor(max_workers=32, thread_name_prefix='dataforge-scan')
+
+def _get_generator():
+    global _generator
+    with _init_lock:
+        if _generator is None:
+            # Imported here so the download and listing endpoints don't depend on the generator's stack
+            from dataforge.core.dataset_generator import DatasetGenerator
+            from dataforge.config.config_manager import ConfigManager
+            _generator = DatasetGenerator(ConfigManager().config)
+    return _generator
+
+def _start_janitor():
+    """Start the ZIP cache and job file pruning thread once per process, on first use"""
+    global _janitor_started
+    with _init_lock:
+        if _janitor_started:
+            return
+        _janitor_started = True
+    threading.Thread(target=_janitor, name='dataforge-prune', daemon=True).start()
 
 def verify_api_key():
     """Verify API key from request header"""
-    auth_header = request.headers.get('Authorization')
-    if not auth_header or not auth_header.startswith('Bearer '):
-        return False
-    token = auth_header.replace('Bearer ', '')
-    return token == API_KEY
+    auth_header = request.headers.get('Authorization', '')
+    return hmac.compare_digest(auth_header.encode('latin-1', 'replace'), _AUTH_HEADER)
+
+@lru_cache(maxsize=4096)
+def _iso_timestamp(seconds):
+    """ISO-format a whole-second timestamp; batch-generated files share most of them"""
+    return datetime.fromtimestamp(seconds).isoformat()
+
+def _keyword_dir_signature(path):
+    """Newest mtime across a keyword directory and its CSVs, plus the CSV entries themselves"""
+    dir_mtime_ns = os.stat(path).st_mtime_ns
+    with os.scandir(path) as entries:
+        csv_entries = [e for e in entries if e.name.endswith('.csv') and e.is_file()]
+    # Rewriting a CSV in place leaves the directory mtime alone, so fold in the files' own
+    return max([dir_mtime_ns, *(e.stat().st_mtime_ns for e in csv_entries)]), csv_entries
+
+@lru_cache(maxsize=1024)
+def _scan_keyword_dir(path, signature):
+    """Collect CSV metadata for a keyword directory; cached until its signature changes"""
+    keyword = os.path.basename(path)
+    files = []
+    total_size = 0
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if not entry.name.endswith('.csv') or not entry.is_file():
+                continue
+            stat = entry.stat()
+            total_size += stat.st_size
+            files.append({
+                'filename': entry.name,
+                'size': stat.st_size,
+                'created': _iso_timestamp(int(stat.st_ctime)),
+                'download_url': f'/api/download/{keyword}/{entry.name}'
+            })
+    return files, total_size
+
+def _send_download(file_path, download_name, mimetype, stat=None):
+    """Build an attachment response, letting the server do zero-copy sends where it can"""
+    stat = stat or os.stat(file_path)
+    etag = f"{stat.st_mtime_ns:x}-{stat.st_size:x}"
+    if request.if_none_match.contains(etag):
+        response = Response(status=304)
+        response.set_etag(etag)
+        return response
+    
+    if app.use_x_sendfile:
+        return send_file(
+            file_path.resolve(),
+            as_attachment=True,
+            download_name=download_name,
+            mimetype=mimetype
+        )
+    
+    f = open(file_path, 'rb')
+    # Length and validators come from the open file, so they match the bytes sent
+    stat = os.fstat(f.fileno())
+    
+    # send_file hands the wrapper 8 KiB blocks; use 1 MiB for werkzeug's read fallback
+    response = Response(
+        wrap_file(request.environ, f, buffer_size=DOWNLOAD_BUFFER_SIZE),
+        mimetype=mimetype,
+        headers={'Content-Disposition': f'attachment; filename="{download_name}"'},
+        direct_passthrough=True
+    )
+    response.content_length = stat.st_size
+    response.set_etag(f"{stat.st_mtime_ns:x}-{stat.st_size:x}")
+    response.last_modified = stat.st_mtime
+    # Range/206 and If-Modified-Since handling, as send_file(conditional=True) does
+    return response.make_conditional(request, accept_ranges=True, complete_length=stat.st_size)
+
+def _build_keyword_zip(keyword_dir, signature, csv_entries):
+    """Return the cached archive for a keyword directory, building it if any CSV changed"""
+    keyword = os.path.basename(keyword_dir)
+    sig = hashlib.blake2b(f"{keyword}:{signature}:deflated".encode(), digest_size=8).hexdigest()
+    zip_path = ZIP_CACHE_PATH / f"{keyword}-{sig}.zip"
+    if zip_path.exists():
+        return zip_path
+    
+    # Deflated once per change of the CSVs; every later download reuses the archive
+    _start_janitor()
+    with _init_lock:
+        build_lock = _zip_build_locks.setdefault(keyword, threading.Lock())
+    with build_lock:
+        if zip_path.exists():
+            return zip_path
+        
+        # Unique temp file, since other worker processes may be building the same archive
+        ZIP_CACHE_PATH.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=ZIP_CACHE_PATH, prefix=f"{keyword}-", suffix='.zip.tmp')
+        try:
+            # mkstemp creates 0600; a fronting server serving X-Sendfile may run as another user
+            os.fchmod(fd, 0o644)
+            with os.fdopen(fd, 'wb') as f, zipfile.ZipFile(f, 'w', zipfile.ZIP_DEFLATED) as zipf:
+                for entry in csv_entries:
+                    zipf.write(entry.path, entry.name)
+            os.replace(tmp_path, zip_path)
+        except BaseException:
+            with suppress(FileNotFoundError):
+                os.remove(tmp_path)
+            raise
+    return zip_path
+
+def _prune_zip_cache():
+    """Evict cached archives that went unused too long or overflow the size cap, oldest first"""
+    try:
+        with os.scandir(ZIP_CACHE_PATH) as entries:
+            cached = [(e.path, e.stat()) for e in entries if e.is_file()]
+    except FileNotFoundError:
+        return
+    
+    now = time.time()
+    total_size = 0
+    for path, stat in sorted(cached, key=lambda item: item[1].st_atime, reverse=True):
+        total_size += stat.st_size
+        if now - stat.st_atime > ZIP_CACHE_MAX_AGE or total_size > ZIP_CACHE_MAX_BYTES:
+            with suppress(FileNotFoundError):
+                os.remove(path)
+
+def _prune_jobs():
+    """Expire job records, including ones left queued by a worker that exited"""
+    try:
+        with os.scandir(JOBS_PATH) as entries:
+            jobs = [(e.path, e.stat().st_mtime) for e in entries if e.is_file() and not e.name.startswith('.')]
+    except FileNotFoundError:
+        return
+    
+    now = time.time()
+    for path, mtime in jobs:
+        if now - mtime > JOBS_MAX_AGE:
+            with suppress(FileNotFoundError):
+                os.remove(path)
+
+def _janitor():
+    while True:
+        _prune_zip_cache()
+        _prune_jobs()
+        time.sleep(ZIP_CACHE_PRUNE_INTERVAL)
+
+def _count_datasets():
+    """Count dataset directories, rescanning at most once per HEALTH_CACHE_TTL"""
+    global _datasets_count_cache
+    now = time.monotonic()
+    if _datasets_count_cache and now - _datasets_count_cache[0] < HEALTH_CACHE_TTL:
+        return _datasets_count_cache[1]
+    try:
+        with os.scandir(DATASETS_PATH) as entries:
+            count = sum(1 for _ in entries)
+    except FileNotFoundError:
+        count = 0
+    _datasets_count_cache = (now, count)
+    return count
+
+def _datasets_signature():
+    """Signature of every keyword directory under the datasets root, in scan order"""
+    with os.scandir(DATASETS_PATH) as entries:
+        keyword_dirs = [e.path for e in entries if e.is_dir(follow_symlinks=False)]
+    
+    # os.stat releases the GIL, so cold-cache directory scans overlap their seeks
+    signatures = _scan_executor.map(lambda path: _keyword_dir_signature(path)[0], keyword_dirs)
+    return tuple(zip(keyword_dirs, signatures))
+
+def _build_manifest(signature):
+    """Serialize the dataset listing served by /api/datasets"""
+    datasets = []
+    scans = _scan_executor.map(lambda item: _scan_keyword_dir(*item), signature or ())
+    for (path, _), (files, total_size) in zip(signature or (), scans):
+        if files:
+            keyword = os.path.basename(path)
+            datasets.append({
+                'keyword': keyword,
+                'files': files,
+                'file_count': len(files),
+                'total_size': total_size,
+                'zip_download_url': f'/api/download-zip/{keyword}'
+            })
+    
+    return orjson.dumps({
+        'datasets': datasets,
+        'total_keywords': len(datasets),
+        'api_version': '2.0.0'
+    })
+
+def _write_job(job_id, **state):
+    """Persist job state to disk so any server worker can report it"""
+    JOBS_PATH.mkdir(parents=True, exist_ok=True)
+    job_file = JOBS_PATH / f"{job_id}.json"
+    tmp_file = job_file.with_suffix('.tmp')
+    tmp_file.write_bytes(orjson.dumps({'job_id': job_id, **state}))
+    os.replace(tmp_file, job_file)
+
+@contextmanager
+def _generation_slot():
+    """Hold the generation lock shared by every worker process on this host"""
+    if fcntl is None:
+        yield
+        return
+    
+    JOBS_PATH.mkdir(parents=True, exist_ok=True)
+    with open(GENERATION_LOCK_PATH, 'a') as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        yield
+
+def _run_generation_job(job_id, keyword, rows, variations):
+    """Run a queued generation and record its outcome"""
+    try:
+        with _generation_slot():
+            _write_job(job_id, status='started', keyword=keyword)
+            results = _get_generator().generate_datasets(keyword, rows, variations)
+    except Exception as e:
+        logger.error(f"Generation job {job_id} failed: {e}")
+        _write_job(job_id, status='failed', keyword=keyword, error=str(e))
+        return
+    
+    _write_job(
+        job_id,
+        status='finished',
+        keyword=keyword,
+        results=results,
+        download_urls={
+            'zip': f'/api/download-zip/{keyword}',
+            'list': '/api/datasets'
+        }
+    )
 
 @app.route('/api/health', methods=['GET'])
 def health_check():
     """Health check endpoint"""
-    return jsonify({
-        'status': 'healthy',
-        'timestamp': datetime.now().isoformat(),
-        'version': '2.0.0',
-        'datasets_available': len(list(DATASETS_PATH.glob('*'))) if DATASETS_PATH.exists() else 0
-    })
+    return Response(
+        orjson.dumps({
+            **_HEALTH_PAYLOAD,
+            'timestamp': datetime.now().isoformat(),
+            'datasets_available': _count_datasets()
+        }),
+        mimetype='application/json'
+    )
+
+@app.route('/api/_authz', methods=['GET'])
+def authorize():
+    """Auth subrequest target for a fronting nginx serving downloads itself"""
+    return ('', 204) if verify_api_key() else ('', 401)
 
 @app.route('/api/datasets', methods=['GET'])
 def list_datasets():
     """List all available datasets"""
+    global _manifest_cache
     if not verify_api_key():
         return jsonify({'error': 'Invalid API key'}), 401
     
     try:
-        datasets = []
-        if DATASETS_PATH.exists():
-            for keyword_dir in DATASETS_PATH.iterdir():
-                if keyword_dir.is_dir():
-                    files = []
-                    total_size = 0
-                    for csv_file in keyword_dir.glob('*.csv'):
-                        file_size = csv_file.stat().st_size
-                        total_size += file_size
-                        files.append({
-                            'filename': csv_file.name,
-                            'size': file_size,
-                            'created': datetime.fromtimestamp(csv_file.stat().st_ctime).isoformat(),
-                            'download_url': f'/api/download/{keyword_dir.name}/{csv_file.name}'
-                        })
-                    
-                    if files:
-                        datasets.append({
-                            'keyword': keyword_dir.name,
-                            'files': files,
-                            'file_count': len(files),
-                            'total_size': total_size,
-                            'zip_download_url': f'/api/download-zip/{keyword_dir.name}'
-                        })
+        signature = _datasets_signature() if DATASETS_PATH.exists() else None
+        if _manifest_cache is None or _manifest_cache[0] != signature:
+            _manifest_cache = (signature, _build_manifest(signature))
         
-        return jsonify({
-            'datasets': datasets,
-            'total_keywords': len(datasets),
-            'api_version': '2.0.0'
-        })
+        response = Response(_manifest_cache[1], mimetype='application/json')
+        response.headers['Cache-Control'] = 'private, max-age=5, stale-while-revalidate=30'
+        return response
     
     except Exception as e:
         logger.error(f"Error listing datasets: {e}")
@@ -86,19 +385,19 @@ def download_file(keyword, filename):
         return jsonify({'error': 'Invalid API key'}), 401
     
     try:
-        file_path = DATASETS_PATH / keyword / filename
-        if not file_path.exists():
-            return jsonify({'error': 'File not found'}), 404
+        if not (_is_safe_keyword(keyword) and _is_safe_filename(filename)):
+            return jsonify({'error': 'Invalid keyword or filename'}), 400
         
-        if not file_path.suffix.lower() == '.csv':
+        if not filename.lower().endswith('.csv'):
             return jsonify({'error': 'Only CSV files allowed'}), 403
         
-        return send_file(
-            file_path,
-            as_attachment=True,
-            download_name=filename,
-            mimetype='text/csv'
-        )
+        file_path = DATASETS_PATH / keyword / filename
+        try:
+            stat = os.stat(file_path)
+        except FileNotFoundError:
+            return jsonify({'error': 'File not found'}), 404
+        
+        return _send_download(file_path, filename, 'text/csv', stat)
     
     except Exception as e:
         logger.error(f"Error downloading file: {e}")
@@ -111,24 +410,17 @@ def download_keyword_zip(keyword):
         return jsonify({'error': 'Invalid API key'}), 401
     
     try:
+        if not _is_safe_keyword(keyword):
+            return jsonify({'error': 'Invalid keyword'}), 400
+        
         keyword_dir = DATASETS_PATH / keyword
-        if not keyword_dir.exists():
+        try:
+            signature, csv_entries = _keyword_dir_signature(keyword_dir)
+        except FileNotFoundError:
             return jsonify({'error': 'Keyword not found'}), 404
         
-        # Create temporary ZIP file
-        temp_dir = tempfile.mkdtemp()
-        zip_path = Path(temp_dir) / f"{keyword}_datasets.zip"
-        
-        with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-            for csv_file in keyword_dir.glob('*.csv'):
-                zipf.write(csv_file, csv_file.name)
-        
-        return send_file(
-            zip_path,
-            as_attachment=True,
-            download_name=f"{keyword}_datasets.zip",
-            mimetype='application/zip'
-        )
+        zip_path = _build_keyword_zip(keyword_dir, signature, csv_entries)
+        return _send_download(zip_path, f"{keyword}_datasets.zip", 'application/zip')
     
     except Exception as e:
         logger.error(f"Error creating ZIP: {e}")
@@ -149,29 +441,52 @@ def trigger_generation():
         if not keyword:
             return jsonify({'error': 'Keyword is required'}), 400
         
-        # Import and run generator
-        sys.path.insert(0, str(Path(__file__).parent / "src"))
-        from dataforge.core.dataset_generator import DatasetGenerator
-        from dataforge.config.config_manager import ConfigManager
-        
-        config_manager = ConfigManager()
-        generator = DatasetGenerator(config_manager.config)
-        
-        results = generator.generate_datasets(keyword, rows, variations)
+        job_id = uuid.uuid4().hex
+        _start_janitor()
+        _write_job(job_id, status='queued', keyword=keyword)
+        _job_executor.submit(_run_generation_job, job_id, keyword, rows, variations)
         
         return jsonify({
-            'status': 'success',
-            'results': results,
-            'download_urls': {
-                'zip': f'/api/download-zip/{keyword}',
-                'list': f'/api/datasets'
-            }
-        })
+            'status': 'queued',
+            'job_id': job_id,
+            'status_url': f'/api/jobs/{job_id}'
+        }), 202
     
     except Exception as e:
         logger.error(f"Error in generation: {e}")
         return jsonify({'error': str(e)}), 500
 
+@app.route('/api/jobs/<job_id>', methods=['GET'])
+def job_status(job_id):
+    """Report the state of a queued generation job"""
+    if not verify_api_key():
+        return jsonify({'error': 'Invalid API key'}), 401
+    
+    job_file = JOBS_PATH / f"{job_id}.json"
+    if not job_id.isalnum() or not job_file.exists():
+        return jsonify({'error': 'Job not found'}), 404
+    
+    return Response(job_file.read_bytes(), mimetype='application/json')
+
+def run_server(host='0.0.0.0', port=5000):
+    """Serve the API through gunicorn, falling back to Flask's server where unavailable"""
+    logging.basicConfig(level=logging.INFO)
+    
+    try:
+        from gunicorn.app.wsgiapp import run
+    except ImportError:
+        # gunicorn is POSIX-only; Windows installs keep the threaded dev server
+        app.run(host=host, port=port, debug=False, threaded=True)
+        return
+    
+    # gthread workers: generation and directory scans need real OS threads, which
+    # gevent's monkey-patching would turn into greenlets sharing one hub
+    sys.argv = [
+        'gunicorn', '-w', '4', '-k', 'gthread', '--threads', '8',
+        '-b', f'{host}:{port}', 'api_server:app'
+    ]
+    run()
+
 if __name__ == '__main__':
     print("DataForge API Server Starting")
     print("API Base URL: http://localhost:5000")
@@ -182,7 +497,10 @@ if __name__ == '__main__':
     print("   GET  /api/download/<keyword>/<filename>")
     print("   GET  /api/download-zip/<keyword>")
     print("   POST /api/generate")
+    print("   GET  /api/jobs/<job_id>")
     print("\nUsage Example:")
     print("   curl -H 'Authorization: Bearer algonomy' http://localhost:5000/api/datasets")
+    print("\nProduction:")
+    print("   gunicorn -w 4 -k gthread --threads 8 -b 0.0.0.0:5000 api_server:app")
     
-    app.run(host='0.0.0.0', port=5000, debug=False, threaded=True)
+    run_server()
@@ -1,53 +1,109 @@
 import sys
 import os
+import logging
 import threading
 from pathlib import Path
-import tkinter as tk
 
 # Add src directory to Python path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
+from dataforge.utils.fs import ensure_dir
+
 # Create required directories
 for directory in ["data/generated_datasets", "data/reference_datasets", "config", "logs"]:
-    Path(directory).mkdir(parents=True, exist_ok=True)
+    ensure_dir(directory)
 
-from dataforge.utils.logger import setup_logging
-from dataforge.gui.main_window import DataForgeApp
-from dataforge.config.config_manager import ConfigManager
+logger = logging.getLogger('dataforge')
 
-def start_api_server():
-    """Start the API server in a separate thread"""
+def start_api_server(config):
+    """Run the API server inside this process; meant to be a daemon thread's target"""
+    api_config = config.get('api', {})
     try:
-        import subprocess
-        subprocess.Popen([sys.executable, "api_server.py"], 
-                        stdout=subprocess.DEVNULL, 
-                        stderr=subprocess.DEVNULL)
+        try:
+            from api_server import app
+        except ImportError:
+            # API dependencies missing from this interpreter; fall back to a child process
+            import subprocess
+            subprocess.Popen([sys.executable, "api_server.py"], 
+                            stdout=subprocess.DEVNULL, 
+                            stderr=subprocess.DEVNULL)
+            return
+        
+        app.run(
+            host=api_config.get('host', '0.0.0.0'),
+            port=api_config.get('port', 5000),
+            debug=False,
+            threaded=True,
+            use_reloader=False
+        )
     except Exception as e:
-        print(f"Could not start API server: {e}")
+        logger.warning(f"Could not start API server: {e}")
 
 def main():
     try:
-        # Load configuration
-        config_manager = ConfigManager()
-        config = config_manager.config
+        import tkinter as tk
         
-        # Setup logging
-        logger = setup_logging(config)
-        logger.info("DataForge application starting")
+        # Put a window on screen before the heavy GUI/pandas imports
+        root = tk.Tk()
+        root.title("DataForge")
+        splash = tk.Label(root, text="Loading DataForge...")
+        splash.pack(expand=True, padx=40, pady=40)
+        root.update()
         
-        # Start API server in background
-        api_thread = threading.Thread(target=start_api_server, daemon=True)
-        api_thread.start()
+        # Load configuration and logging off the main thread
+        ready = threading.Event()
+        startup = {}
         
-        # Create and run GUI
-        root = tk.Tk()
-        app = DataForgeApp(root, config_manager, logger)
-        root.mainloop()
+        def load_config():
+            try:
+                from dataforge.config.config_manager import ConfigManager
+                from dataforge.utils.logger import setup_logging
+                
+                startup['config_manager'] = ConfigManager()
+                setup_logging(startup['config_manager'].config)
+            except Exception as e:
+                startup['error'] = e
+            finally:
+                ready.set()
         
-    except Exception as e:
-        print(f"Critical error: {e}")
-        import traceback
-        traceback.print_exc()
+        threading.Thread(target=load_config, daemon=True).start()
+        
+        from dataforge.gui.main_window import DataForgeApp
+        
+        def finish_startup():
+            if not ready.is_set():
+                root.after(50, finish_startup)
+                return
+            
+            if 'error' in startup:
+                logger.error(f"Critical error: {startup['error']}")
+                root.destroy()
+                return
+            
+            # Runs as a Tk callback, outside main()'s try; fail the same way it would
+            try:
+                logger.info("DataForge application starting")
+                
+                # Start API server in background
+                api_thread = threading.Thread(
+                    target=start_api_server,
+                    args=(startup['config_manager'].config,),
+                    daemon=True
+                )
+                api_thread.start()
+                
+                # Create the GUI
+                splash.destroy()
+                startup['app'] = DataForgeApp(root, startup['config_manager'], logger)
+            except Exception:
+                logger.exception("Critical error")
+                root.destroy()
+        
+        root.after(50, finish_startup)
+        root.mainloop()
+    
+    except Exception:
+        logger.exception("Critical error")
 
 if __name__ == "__main__":
     main()
@@ -1,7 +1,19 @@
-import json
+import copy
 import logging
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Tuple
+
+try:
+    import orjson
+    _loads = orjson.loads
+    _dumps = lambda obj: orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    import json
+    _loads = json.loads
+    _dumps = lambda obj: json.dumps(obj, indent=4).encode()
+
+# Parsed configs keyed by (resolved path, mtime_ns); each ConfigManager gets its own copy
+_CACHE: Dict[Tuple[str, int], Dict[str, Any]] = {}
 
 class ConfigManager:
     DEFAULT_CONFIG = {
@@ -17,13 +29,18 @@ class ConfigManager:
         self.config = self._load_config()
     
     def _load_config(self) -> Dict[str, Any]:
-        if self.config_file.exists():
+        try:
+            st = self.config_file.stat()
+        except OSError:
+            return self.DEFAULT_CONFIG
+        
+        key = (str(self.config_file.resolve()), st.st_mtime_ns)
+        if key not in _CACHE:
             try:
-                with open(self.config_file, 'r') as f:
-                    return json.load(f)
+                _CACHE[key] = _loads(self.config_file.read_bytes())
             except Exception:
                 return self.DEFAULT_CONFIG
-        return self.DEFAULT_CONFIG
+        return copy.deepcopy(_CACHE[key])
     
     def get(self, key: str, default: Any = None) -> Any:
         keys = key.split('.')
@@ -37,7 +54,11 @@ class ConfigManager:
     
     def save_config(self) -> None:
         try:
-            with open(self.config_file, 'w') as f:
-                json.dump(self.config, f, indent=4)
+            with open(self.config_file, 'wb') as f:
+                f.write(_dumps(self.config))
+            
+            path = str(self.config_file.resolve())
+            for key in [k for k in _CACHE if k[0] == path]:
+                del _CACHE[key]
         except Exception as e:
             print(f"Error saving config: {e}")
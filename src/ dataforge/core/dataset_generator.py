@@ -1,13 +1,43 @@
 import os
+import csv
+import hashlib
+import io
 import logging
 import time
-import random
+import re
 from pathlib import Path
-from typing import Dict, Any, Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Any, Callable, Iterator, List, Optional, Union
+import numpy as np
+import orjson
 import pandas as pd
 
 from dataforge.handlers.kaggle_handler import KaggleDatasetHandler
 from dataforge.handlers.mistral_handler import MistralHandler
+from dataforge.utils.fs import ensure_dir
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:
+    pa = pacsv = None
+
+WRITE_BUFFER_SIZE = 1024 * 1024
+PROGRAMMATIC_CHUNK_ROWS = 10_000
+SCHEMA_SAMPLE_ROWS = 20
+# Cached Ollama outputs kept on disk; least recently used files are pruned beyond this
+MISTRAL_CACHE_MAX_ENTRIES = 256
+_NON_SPACE = re.compile(r'\S')
+
+# Value pools for the programmatic column generators, built once at import
+_HEALTH_CONDITIONS = np.array(['Hypertension', 'Diabetes Type 2', 'Asthma', 'Arthritis', 'Migraine', 'Pneumonia', 'Depression'])
+_FINANCE_TYPES = np.array(['Checking', 'Savings', 'Credit', 'Investment', 'Loan'])
+_FINANCE_TRANSACTIONS = np.array(['Deposit', 'Withdrawal', 'Transfer', 'Payment', 'Fee'])
+_COURSES = np.array(['Mathematics', 'Science', 'English', 'History', 'Art', 'Computer Science', 'Biology'])
+_SEMESTERS = np.array(['Fall2024', 'Spring2024', 'Summer2024', 'Fall2023', 'Spring2025'])
+_EMAIL_DOMAINS = np.array(['gmail.com', 'yahoo.com', 'company.com', 'business.org'])
+# Every 2024 date the generators emit (days 1-28), indexed as month * 28 + day
+_DATES_2024 = np.array([f"2024-{m:02d}-{d:02d}" for m in range(1, 13) for d in range(1, 29)])
 
 class DatasetGenerator:
     def __init__(self, config: Dict[str, Any]):
@@ -18,11 +48,13 @@ class DatasetGenerator:
         self.progress_callback = None
         self.status_callback = None
         self.should_stop = False
+        # Column plans shared by every variation of the same schema and keyword
+        self._column_plans: Dict[tuple, tuple] = {}
         self.base_path = Path.cwd()
         self.reference_path = self.base_path / config.get('paths', {}).get('reference_datasets', 'data/reference_datasets')
         self.generated_path = self.base_path / config.get('paths', {}).get('generated_datasets', 'data/generated_datasets')
-        self.reference_path.mkdir(parents=True, exist_ok=True)
-        self.generated_path.mkdir(parents=True, exist_ok=True)
+        ensure_dir(self.reference_path)
+        ensure_dir(self.generated_path)
         self.logger.info("Enhanced DatasetGenerator initialized successfully")
     def set_progress_callback(self, callback: Callable[[float, str], None]) -> None:
         self.progress_callback = callback
@@ -62,26 +94,30 @@ class DatasetGenerator:
             self._update_status("Extracting enhanced schema")
             schema = self._extract_enhanced_schema(reference_file, keyword)
             output_dir = self.generated_path / keyword
-            output_dir.mkdir(exist_ok=True)
-            for i in range(num_variations):
-                if self.should_stop:
-                    self._update_status("Generation stopped by user")
-                    break
-                progress = 0.3 + (i / num_variations) * 0.6
-                self._update_progress(progress, f"🎨 Creating dataset {i+1}/{num_variations}")
-                self._update_status(f"Generating high-quality synthetic dataset {i+1} of {num_variations}")
-                csv_data = self._generate_enhanced_dataset(schema, num_rows, keyword, i+1)
-                timestamp = int(time.time())
-                filename = f"{keyword}_synthetic_v{i+1}_{timestamp}.csv"
-                output_file = output_dir / filename
-                
-                with open(output_file, 'w', encoding='utf-8', newline='') as f:
-                    f.write(csv_data)
-                
-                results['generated_files'].append(str(output_file))
-                self.logger.info(f"Generated: {output_file}")
-                
-                time.sleep(0.3)
+            output_dir.mkdir(parents=True, exist_ok=True)
+            # Variations are independent and mostly wait on Ollama, so overlap them
+            # Progress follows completion order, but files are reported in variation order
+            completed = 0
+            output_files = [None] * num_variations
+            with ThreadPoolExecutor(max_workers=max(1, min(num_variations, 4))) as executor:
+                futures = {
+                    executor.submit(self._make_one_variation, schema, num_rows, keyword, i + 1, num_variations, output_dir): i
+                    for i in range(num_variations)
+                }
+                try:
+                    for future in as_completed(futures):
+                        output_file = future.result()
+                        completed += 1
+                        if output_file is None:
+                            continue
+                        output_files[futures[future]] = output_file
+                        progress = 0.3 + (completed / num_variations) * 0.6
+                        self._update_progress(progress, f"🎨 Created dataset {completed}/{num_variations}")
+                finally:
+                    results['generated_files'].extend(str(f) for f in output_files if f is not None)
+            
+            if self.should_stop:
+                self._update_status("Generation stopped by user")
             
             self._update_progress(1.0, "Generation completed successfully")
             self._update_status(f"Successfully generated {len(results['generated_files'])} high-quality datasets")
@@ -93,7 +129,7 @@ class DatasetGenerator:
             if not results['generated_files']:
                 try:
                     output_dir = self.generated_path / keyword
-                    output_dir.mkdir(exist_ok=True)
+                    output_dir.mkdir(parents=True, exist_ok=True)
                     fallback_file = output_dir / f"{keyword}_fallback.csv"
                     self._create_enhanced_fallback(fallback_file, keyword, num_rows)
                     results['generated_files'].append(str(fallback_file))
@@ -104,6 +140,24 @@ class DatasetGenerator:
             results['total_time'] = time.time() - start_time
             return results
     
+    def _make_one_variation(self, schema: Dict, num_rows: int, keyword: str, variation: int, num_variations: int, output_dir: Path) -> Optional[Path]:
+        if self.should_stop:
+            return None
+        self._update_status(f"Generating high-quality synthetic dataset {variation} of {num_variations}")
+        csv_data = self._generate_enhanced_dataset(schema, num_rows, keyword, variation)
+        timestamp = int(time.time())
+        filename = f"{keyword}_synthetic_v{variation}_{timestamp}.csv"
+        output_file = output_dir / filename
+        
+        with open(output_file, 'w', encoding='utf-8', newline='', buffering=WRITE_BUFFER_SIZE) as f:
+            if isinstance(csv_data, str):
+                f.write(csv_data)
+            else:
+                f.writelines(csv_data)
+        
+        self.logger.info(f"Generated: {output_file}")
+        return output_file
+    
     def _get_reference_data(self, keyword: str) -> Path:
         try:
             dataset_metadata = self.kaggle_handler.search_datasets(keyword)
@@ -125,37 +179,43 @@ class DatasetGenerator:
     def _create_reference_template(self, keyword: str) -> Path:
         """Create domain-specific reference template"""
         reference_file = self.reference_path / f"{keyword}_reference.csv"
+        self.reference_path.mkdir(parents=True, exist_ok=True)
+        
+        n = 50
+        rng = np.random.default_rng()
+        seq = np.arange(1, n + 1)
+        padded_seq = np.char.zfill(seq.astype(str), 4)
         
         templates = {
             'healthcare': {
-                'patient_id': range(1001, 1051),
-                'age': [random.randint(18, 85) for _ in range(50)],
-                'gender': [random.choice(['Male', 'Female', 'Other']) for _ in range(50)],
-                'diagnosis': [random.choice(['Hypertension', 'Diabetes', 'Asthma', 'Arthritis']) for _ in range(50)],
-                'treatment_cost': [round(random.uniform(100, 5000), 2) for _ in range(50)]
+                'patient_id': np.arange(1001, 1001 + n),
+                'age': rng.integers(18, 86, n),
+                'gender': rng.choice(['Male', 'Female', 'Other'], n),
+                'diagnosis': rng.choice(['Hypertension', 'Diabetes', 'Asthma', 'Arthritis'], n),
+                'treatment_cost': rng.uniform(100, 5000, n).round(2)
             },
             'finance': {
-                'account_id': [f"ACC{i:04d}" for i in range(1, 51)],
-                'balance': [round(random.uniform(100, 50000), 2) for _ in range(50)],
-                'account_type': [random.choice(['Checking', 'Savings', 'Credit']) for _ in range(50)],
-                'transaction_count': [random.randint(1, 100) for _ in range(50)],
-                'last_activity': [f"2024-{random.randint(1,12):02d}-{random.randint(1,28):02d}" for _ in range(50)]
+                'account_id': np.char.add('ACC', padded_seq),
+                'balance': rng.uniform(100, 50000, n).round(2),
+                'account_type': rng.choice(['Checking', 'Savings', 'Credit'], n),
+                'transaction_count': rng.integers(1, 101, n),
+                'last_activity': self._random_dates(rng, n)
             },
             'education': {
-                'student_id': [f"STU{i:04d}" for i in range(1, 51)],
-                'course_name': [random.choice(['Mathematics', 'Science', 'English', 'History']) for _ in range(50)],
-                'grade': [round(random.uniform(60, 100), 1) for _ in range(50)],
-                'credits': [random.choice([1, 2, 3, 4]) for _ in range(50)],
-                'semester': [random.choice(['Fall2024', 'Spring2024', 'Summer2024']) for _ in range(50)]
+                'student_id': np.char.add('STU', padded_seq),
+                'course_name': rng.choice(['Mathematics', 'Science', 'English', 'History'], n),
+                'grade': rng.uniform(60, 100, n).round(1),
+                'credits': rng.integers(1, 5, n),
+                'semester': rng.choice(['Fall2024', 'Spring2024', 'Summer2024'], n)
             }
         }
         
         template_data = templates.get(keyword.lower(), {
-            'id': range(1, 51),
-            'name': [f"{keyword}_item_{i}" for i in range(1, 51)],
-            'value': [round(random.uniform(10, 1000), 2) for _ in range(50)],
-            'category': [f"cat_{i%5}" for i in range(50)],
-            'status': [random.choice(['active', 'inactive']) for _ in range(50)]
+            'id': seq,
+            'name': np.char.add(f"{keyword}_item_", seq.astype(str)),
+            'value': rng.uniform(10, 1000, n).round(2),
+            'category': np.char.add('cat_', (np.arange(n) % 5).astype(str)),
+            'status': rng.choice(['active', 'inactive'], n)
         })
         
         df = pd.DataFrame(template_data)
@@ -164,8 +224,25 @@ class DatasetGenerator:
         return reference_file
     
     def _extract_enhanced_schema(self, dataset_path: Path, keyword: str) -> Dict[str, Any]:
+        # Optional column subset from config; unknown names are ignored
+        schema_columns = self.config.get('generation', {}).get('schema_columns')
+        usecols = set(schema_columns).__contains__ if schema_columns else None
+        
+        cache_file = None
         try:
-            df = pd.read_csv(dataset_path, nrows=20)
+            stat = dataset_path.stat()
+            cache_key = hashlib.blake2b(
+                f"{dataset_path.resolve()}-{stat.st_mtime_ns}-{stat.st_size}-{keyword}-{schema_columns}".encode(),
+                digest_size=16
+            ).hexdigest()
+            cache_file = self.reference_path / ".schema_cache" / f"{cache_key}.json"
+            if cache_file.exists():
+                return orjson.loads(cache_file.read_bytes())
+        except Exception as e:
+            self.logger.warning(f"Schema cache lookup failed: {e}")
+        
+        try:
+            df = self._read_schema_sample(dataset_path, usecols)
             schema = {
                 'columns': [],
                 'sample_data': {},
@@ -179,7 +256,7 @@ class DatasetGenerator:
                     'dtype': str(df[col].dtype),
                     'sample_value': str(df[col].iloc[0]) if len(df) > 0 else "",
                     'unique_values': min(df[col].nunique(), 10),
-                    'null_count': df[col].isnull().sum()
+                    'null_count': int(df[col].isnull().sum())
                 }
                 if df[col].dtype in ['int64', 'float64']:
                     col_info['min_value'] = float(df[col].min())
@@ -189,12 +266,45 @@ class DatasetGenerator:
                 schema['columns'].append(col_info)
                 schema['sample_data'][col] = col_info['sample_value']
             
+            if cache_file is not None:
+                try:
+                    cache_file.parent.mkdir(parents=True, exist_ok=True)
+                    cache_file.write_bytes(orjson.dumps(schema, option=orjson.OPT_NON_STR_KEYS))
+                except Exception as e:
+                    self.logger.warning(f"Could not cache schema: {e}")
+            
             return schema
             
         except Exception as e:
             self.logger.error(f"Enhanced schema extraction failed: {e}")
             return self._get_fallback_schema(keyword)
     
+    def _read_schema_sample(self, dataset_path: Path, usecols: Optional[Callable[[str], bool]]) -> pd.DataFrame:
+        """Read the first rows of a reference CSV, via PyArrow's streaming reader when installed"""
+        if pacsv is None:
+            return pd.read_csv(dataset_path, nrows=SCHEMA_SAMPLE_ROWS, usecols=usecols)
+        
+        batches = []
+        rows = 0
+        with pacsv.open_csv(dataset_path, read_options=pacsv.ReadOptions(block_size=65536)) as reader:
+            for batch in reader:
+                batches.append(batch)
+                rows += batch.num_rows
+                if rows >= SCHEMA_SAMPLE_ROWS:
+                    break
+            schema = reader.schema
+        
+        table = pa.Table.from_batches(batches, schema=schema).slice(0, SCHEMA_SAMPLE_ROWS)
+        # pandas leaves date-like columns as text; keep the dtypes downstream code expects
+        for i, field in enumerate(table.schema):
+            if pa.types.is_temporal(field.type):
+                table = table.set_column(i, field.name, table.column(i).cast(pa.string()))
+        
+        df = table.to_pandas()
+        if usecols is not None:
+            df = df[[c for c in df.columns if usecols(c)]]
+        return df
+    
     def _get_fallback_schema(self, keyword: str) -> Dict[str, Any]:
         domain_schemas = {
             'healthcare': {
@@ -226,12 +336,32 @@ class DatasetGenerator:
             'sample_data': {}
         })
     
-    def _generate_enhanced_dataset(self, schema: Dict, num_rows: int, keyword: str, variation: int) -> str:
+    def _generate_enhanced_dataset(self, schema: Dict, num_rows: int, keyword: str, variation: int) -> Union[str, Iterator[str]]:
+        cache_key = hashlib.blake2b(
+            orjson.dumps([schema, num_rows, keyword, variation], option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS),
+            digest_size=16
+        ).hexdigest()
+        cache_file = self.base_path / 'data' / 'mistral_cache' / f"{cache_key}.csv"
+        try:
+            cached = cache_file.read_text(encoding='utf-8')
+            os.utime(cache_file)  # mark as recently used for pruning
+            return cached
+        except OSError:
+            pass
+        
         try:
-            result = self.mistral_handler.generate(schema, num_rows, keyword)
+            result, from_llm = self.mistral_handler.generate_with_source(schema, num_rows, keyword)
             
             if result and len(result.strip()) > 50:
                 if self._validate_enhanced_csv(result, schema):
+                    # Only cache model output; the handler's fallback is cheap and should stay random
+                    if from_llm:
+                        try:
+                            cache_file.parent.mkdir(parents=True, exist_ok=True)
+                            cache_file.write_text(result, encoding='utf-8')
+                            self._prune_mistral_cache(cache_file.parent)
+                        except OSError as e:
+                            self.logger.warning(f"Could not cache generated data: {e}")
                     return result
             
         except Exception as e:
@@ -239,143 +369,185 @@ class DatasetGenerator:
         
         return self._generate_programmatic_enhanced(schema, num_rows, keyword, variation)
     
+    def _prune_mistral_cache(self, cache_dir: Path) -> None:
+        """Drop the least recently used cached outputs beyond MISTRAL_CACHE_MAX_ENTRIES"""
+        entries = []
+        with os.scandir(cache_dir) as it:
+            for entry in it:
+                try:
+                    entries.append((entry.stat().st_mtime, entry.path))
+                except OSError:
+                    continue
+        
+        if len(entries) <= MISTRAL_CACHE_MAX_ENTRIES:
+            return
+        
+        entries.sort()
+        for _, path in entries[:len(entries) - MISTRAL_CACHE_MAX_ENTRIES]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+    
     def _validate_enhanced_csv(self, csv_data: str, schema: Dict) -> bool:
         """Enhanced CSV validation"""
         try:
-            lines = csv_data.strip().split('\n')
-            if len(lines) < 2:
+            # Only the header and first data row are inspected, so avoid splitting the whole text
+            first = _NON_SPACE.search(csv_data)
+            if first is None:
+                return False
+            header_end = csv_data.find('\n', first.start())
+            if header_end == -1 or _NON_SPACE.search(csv_data, header_end) is None:
                 return False
             
-            header = lines[0].split(',')
-            expected_cols = [col['name'] for col in schema.get('columns', [])]
-            
-            if len(header) != len(expected_cols):
+            row_end = csv_data.find('\n', header_end + 1)
+            if row_end == -1:
+                row_end = len(csv_data)
+            # csv.reader so quoted commas don't count as separators
+            header, first_row = csv.reader([csv_data[first.start():header_end], csv_data[header_end + 1:row_end]])
+            if len(header) != len(schema.get('columns', [])):
                 return False
-            data_row = lines[1].split(',')
-            return len(data_row) == len(header)
+            return len(first_row) == len(header)
             
         except Exception:
             return False
     
-    def _generate_programmatic_enhanced(self, schema: Dict, num_rows: int, keyword: str, variation: int) -> str:
+    def _generate_programmatic_enhanced(self, schema: Dict, num_rows: int, keyword: str, variation: int) -> Union[str, Iterator[str]]:
         columns = schema.get('columns', [])
         if not columns:
             return self._create_basic_csv(num_rows, keyword)
         
-        headers = [col['name'] for col in columns]
-        csv_lines = [','.join(headers)]
-        
-        for row_num in range(min(num_rows, 200)):
-            row = []
-            for col in columns:
-                value = self._generate_enhanced_value(col, row_num, keyword, variation)
-                row.append(str(value))
-            
-            csv_lines.append(','.join(row))
-        
-        return '\n'.join(csv_lines)
+        return self._iter_programmatic_chunks(columns, num_rows, keyword, variation)
     
-    def _generate_enhanced_value(self, col: Dict, row_num: int, keyword: str, variation: int) -> str:
-        col_name = col['name'].lower()
-        col_type = col.get('dtype', 'object').lower()
+    def _iter_programmatic_chunks(self, columns: List[Dict], num_rows: int, keyword: str, variation: int) -> Iterator[str]:
+        """Yield the CSV text in chunks so memory stays bounded by PROGRAMMATIC_CHUNK_ROWS"""
+        header_line, generate_column, specs, row_format = self._column_plan(columns, keyword)
+        rng = np.random.default_rng(variation)
+        yield header_line
         
-        seed_modifier = variation * 1000 + row_num
+        for start in range(0, num_rows, PROGRAMMATIC_CHUNK_ROWS):
+            # Each column is drawn in one vectorized call per chunk
+            seeds = variation * 1000 + np.arange(start, min(start + PROGRAMMATIC_CHUNK_ROWS, num_rows))
+            values = [generate_column(col_name, col_type, seeds, rng).tolist() for col_name, col_type in specs]
+            yield ''.join(map(row_format.__mod__, zip(*values)))
+    
+    def _column_plan(self, columns: List[Dict], keyword: str) -> tuple:
+        """Header line, domain generator, lowercased (name, dtype) pairs and row template, computed once per schema"""
+        key = (tuple((col['name'], col.get('dtype', 'object')) for col in columns), keyword.lower())
+        plan = self._column_plans.get(key)
+        if plan is None:
+            header = io.StringIO()
+            csv.writer(header, lineterminator='\n').writerow([name for name, _ in key[0]])
+            # Generated values never contain commas, quotes or newlines, so a plain template is valid CSV
+            plan = (
+                header.getvalue(),
+                self._domain_column_generator(keyword),
+                [(name.lower(), dtype.lower()) for name, dtype in key[0]],
+                ','.join(['%s'] * len(key[0])) + '\n'
+            )
+            self._column_plans[key] = plan
+        return plan
+    
+    def _domain_column_generator(self, keyword: str) -> Callable[[str, str, np.ndarray, np.random.Generator], np.ndarray]:
+        """Resolve the keyword's domain once per dataset rather than per column"""
+        keyword = keyword.lower()
         
-        if 'health' in keyword.lower():
-            return self._generate_healthcare_value(col_name, col_type, seed_modifier)
-        elif 'finance' in keyword.lower():
-            return self._generate_finance_value(col_name, col_type, seed_modifier)
-        elif 'education' in keyword.lower():
-            return self._generate_education_value(col_name, col_type, seed_modifier)
+        if 'health' in keyword:
+            return self._generate_healthcare_column
+        elif 'finance' in keyword:
+            return self._generate_finance_column
+        elif 'education' in keyword:
+            return self._generate_education_column
         else:
-            return self._generate_generic_value(col_name, col_type, seed_modifier)
+            return self._generate_generic_column
+    
+    def _random_dates(self, rng: np.random.Generator, n: int) -> np.ndarray:
+        return _DATES_2024[rng.integers(0, 12, n) * 28 + rng.integers(0, 28, n)]
     
-    def _generate_healthcare_value(self, col_name: str, col_type: str, seed: int) -> str:
-        random.seed(seed)
+    def _generate_healthcare_column(self, col_name: str, col_type: str, seeds: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+        n = len(seeds)
         
         if 'patient' in col_name or 'id' in col_name:
-            return str(1000 + (seed % 10000))
+            return (1000 + seeds % 10000).astype(str)
         elif 'age' in col_name:
-            return str(random.randint(1, 95))
+            return rng.integers(1, 96, n).astype(str)
         elif 'diagnosis' in col_name or 'condition' in col_name:
-            conditions = ['Hypertension', 'Diabetes Type 2', 'Asthma', 'Arthritis', 'Migraine', 'Pneumonia', 'Depression']
-            return random.choice(conditions)
+            return rng.choice(_HEALTH_CONDITIONS, n)
         elif 'cost' in col_name or 'price' in col_name:
-            return f"{random.uniform(50, 8000):.2f}"
+            return np.char.mod('%.2f', rng.uniform(50, 8000, n))
         elif 'date' in col_name:
-            return f"2024-{random.randint(1,12):02d}-{random.randint(1,28):02d}"
+            return self._random_dates(rng, n)
         else:
-            return f"Health_Value_{seed % 100}"
+            return np.char.mod('Health_Value_%d', seeds % 100)
     
-    def _generate_finance_value(self, col_name: str, col_type: str, seed: int) -> str:
-        random.seed(seed)
+    def _generate_finance_column(self, col_name: str, col_type: str, seeds: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+        n = len(seeds)
         
         if 'account' in col_name or 'id' in col_name:
-            return f"ACC{(seed % 10000):04d}"
+            return np.char.mod('ACC%04d', seeds % 10000)
         elif 'balance' in col_name or 'amount' in col_name:
-            return f"{random.uniform(100, 100000):.2f}"
+            return np.char.mod('%.2f', rng.uniform(100, 100000, n))
         elif 'type' in col_name:
-            types = ['Checking', 'Savings', 'Credit', 'Investment', 'Loan']
-            return random.choice(types)
+            return rng.choice(_FINANCE_TYPES, n)
         elif 'transaction' in col_name:
-            transactions = ['Deposit', 'Withdrawal', 'Transfer', 'Payment', 'Fee']
-            return random.choice(transactions)
+            return rng.choice(_FINANCE_TRANSACTIONS, n)
         elif 'date' in col_name:
-            return f"2024-{random.randint(1,12):02d}-{random.randint(1,28):02d}"
+            return self._random_dates(rng, n)
         else:
-            return f"Finance_Value_{seed % 100}"
+            return np.char.mod('Finance_Value_%d', seeds % 100)
     
-    def _generate_education_value(self, col_name: str, col_type: str, seed: int) -> str:
-        random.seed(seed)
+    def _generate_education_column(self, col_name: str, col_type: str, seeds: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+        n = len(seeds)
         
         if 'student' in col_name or 'id' in col_name:
-            return f"STU{(seed % 10000):04d}"
+            return np.char.mod('STU%04d', seeds % 10000)
         elif 'grade' in col_name or 'score' in col_name:
-            return f"{random.uniform(60, 100):.1f}"
+            return np.char.mod('%.1f', rng.uniform(60, 100, n))
         elif 'course' in col_name or 'subject' in col_name:
-            courses = ['Mathematics', 'Science', 'English', 'History', 'Art', 'Computer Science', 'Biology']
-            return random.choice(courses)
+            return rng.choice(_COURSES, n)
         elif 'credit' in col_name:
-            return str(random.choice([1, 2, 3, 4, 5]))
+            return rng.integers(1, 6, n).astype(str)
         elif 'semester' in col_name:
-            semesters = ['Fall2024', 'Spring2024', 'Summer2024', 'Fall2023', 'Spring2025']
-            return random.choice(semesters)
+            return rng.choice(_SEMESTERS, n)
         else:
-            return f"Education_Value_{seed % 100}"
+            return np.char.mod('Education_Value_%d', seeds % 100)
     
-    def _generate_generic_value(self, col_name: str, col_type: str, seed: int) -> str:
-        random.seed(seed)
+    def _generate_generic_column(self, col_name: str, col_type: str, seeds: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+        n = len(seeds)
         
         if 'id' in col_name:
-            return str(1000 + (seed % 10000))
+            return (1000 + seeds % 10000).astype(str)
         elif 'name' in col_name:
-            return f"Item_{seed % 1000}"
+            return np.char.mod('Item_%d', seeds % 1000)
         elif 'email' in col_name:
-            domains = ['gmail.com', 'yahoo.com', 'company.com', 'business.org']
-            return f"user{seed % 1000}@{random.choice(domains)}"
+            return np.char.add(np.char.mod('user%d@', seeds % 1000), rng.choice(_EMAIL_DOMAINS, n))
         elif 'int' in col_type:
-            return str(random.randint(1, 1000))
+            return rng.integers(1, 1001, n).astype(str)
         elif 'float' in col_type:
-            return f"{random.uniform(1, 1000):.2f}"
+            return np.char.mod('%.2f', rng.uniform(1, 1000, n))
         elif 'date' in col_name:
-            return f"2024-{random.randint(1,12):02d}-{random.randint(1,28):02d}"
+            return self._random_dates(rng, n)
         else:
-            return f"Value_{seed % 1000}"
+            return np.char.mod('Value_%d', seeds % 1000)
     
     def _create_enhanced_fallback(self, file_path: Path, keyword: str, num_rows: int):
+        n = min(num_rows, 100)
+        rng = np.random.default_rng()
+        ids = np.arange(1, n + 1)
+        
         if 'health' in keyword.lower():
             data = {
-                'patient_id': [f"P{i:04d}" for i in range(1, min(num_rows + 1, 101))],
-                'age': [random.randint(18, 85) for _ in range(min(num_rows, 100))],
-                'condition': [random.choice(['Hypertension', 'Diabetes', 'Asthma']) for _ in range(min(num_rows, 100))],
-                'cost': [round(random.uniform(100, 5000), 2) for _ in range(min(num_rows, 100))]
+                'patient_id': np.char.add('P', np.char.zfill(ids.astype(str), 4)),
+                'age': rng.integers(18, 86, n),
+                'condition': rng.choice(['Hypertension', 'Diabetes', 'Asthma'], n),
+                'cost': rng.uniform(100, 5000, n).round(2)
             }
         else:
             data = {
-                'id': range(1, min(num_rows + 1, 101)),
-                'name': [f"{keyword}_item_{i}" for i in range(1, min(num_rows + 1, 101))],
-                'value': [round(random.uniform(10, 1000), 2) for _ in range(min(num_rows, 100))],
-                'category': [f"category_{i%5}" for i in range(min(num_rows, 100))]
+                'id': ids,
+                'name': np.char.add(f"{keyword}_item_", ids.astype(str)),
+                'value': rng.uniform(10, 1000, n).round(2),
+                'category': np.char.add('category_', (np.arange(n) % 5).astype(str))
             }
         
         df = pd.DataFrame(data)
@@ -383,16 +555,14 @@ class DatasetGenerator:
         self.logger.info(f"Created enhanced fallback: {file_path}")
     
     def _create_basic_csv(self, num_rows: int, keyword: str) -> str:
-        headers = ['id', 'name', 'value', 'status']
-        csv_lines = [','.join(headers)]
+        n = min(num_rows, 50)
+        rng = np.random.default_rng()
+        ids = np.arange(1, n + 1)
         
-        for i in range(min(num_rows, 50)):
-            row = [
-                str(i + 1),
-                f"{keyword}_item_{i + 1}",
-                f"{random.uniform(10, 1000):.2f}",
-                random.choice(['active', 'inactive'])
-            ]
-            csv_lines.append(','.join(row))
-        
-        return '\n'.join(csv_lines)
+        df = pd.DataFrame({
+            'id': ids,
+            'name': np.char.add(f"{keyword}_item_", ids.astype(str)),
+            'value': rng.uniform(10, 1000, size=n),
+            'status': rng.choice(['active', 'inactive'], size=n)
+        })
+        return df.to_csv(index=False, float_format='%.2f', lineterminator='\n')
@@ -1,7 +1,12 @@
 import customtkinter as ctk
 import tkinter as tk
+import os
+import subprocess
+import sys
 from pathlib import Path
 
+from dataforge.gui.fonts import get_font
+
 class ProgressFrame(ctk.CTkFrame):
     def __init__(self, parent, **kwargs):
         super().__init__(parent, **kwargs)
@@ -9,7 +14,7 @@ class ProgressFrame(ctk.CTkFrame):
         title_label = ctk.CTkLabel(
             self,
             text="Generation Progress",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=get_font(size=16, weight="bold")
         )
         title_label.pack(anchor="w", padx=15, pady=(15, 10))
         
@@ -30,7 +35,7 @@ class ProgressFrame(ctk.CTkFrame):
         self.percentage_label = ctk.CTkLabel(
             progress_row,
             text="0%",
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=get_font(size=14, weight="bold"),
             width=50
         )
         self.percentage_label.pack(side="right")
@@ -38,28 +43,22 @@ class ProgressFrame(ctk.CTkFrame):
         self.status_label = ctk.CTkLabel(
             progress_container,
             text="Ready to generate datasets",
-            font=ctk.CTkFont(size=12),
+            font=get_font(size=12),
             anchor="w"
         )
         self.status_label.pack(fill="x", padx=10, pady=(0, 10))
     
     def update_progress(self, value: float, message: str = "", info: str = "") -> None:
-        def _update():
-            self.progress_bar.set(max(0, min(1, value)))
-            percentage = int(value * 100)
-            self.percentage_label.configure(text=f"{percentage}%")
-            if message:
-                self.status_label.configure(text=message)
-        
-        self.after_idle(_update)
+        self.progress_bar.set(max(0, min(1, value)))
+        percentage = int(value * 100)
+        self.percentage_label.configure(text=f"{percentage}%")
+        if message:
+            self.status_label.configure(text=message)
     
     def reset(self) -> None:
-        def _reset():
-            self.progress_bar.set(0)
-            self.percentage_label.configure(text="0%")
-            self.status_label.configure(text="Ready to generate datasets")
-        
-        self.after_idle(_reset)
+        self.progress_bar.set(0)
+        self.percentage_label.configure(text="0%")
+        self.status_label.configure(text="Ready to generate datasets")
 
 class StatusBar(ctk.CTkFrame):
     def __init__(self, parent, **kwargs):
@@ -68,15 +67,13 @@ class StatusBar(ctk.CTkFrame):
         self.status_label = ctk.CTkLabel(
             self,
             text="Ready",
-            font=ctk.CTkFont(size=10),
+            font=get_font(size=10),
             anchor="w"
         )
         self.status_label.pack(side="left", padx=10, pady=5, fill="x", expand=True)
     
     def set_status(self, message: str) -> None:
-        def _update():
-            self.status_label.configure(text=message)
-        self.after_idle(_update)
+        self.status_label.configure(text=message)
 
 class ResultsFrame(ctk.CTkScrollableFrame):
     def __init__(self, parent, **kwargs):
@@ -85,7 +82,7 @@ class ResultsFrame(ctk.CTkScrollableFrame):
         self.title_label = ctk.CTkLabel(
             self,
             text="Generation Results",
-            font=ctk.CTkFont(size=18, weight="bold")
+            font=get_font(size=18, weight="bold")
         )
         self.title_label.pack(anchor="w", padx=10, pady=(10, 20))
         
@@ -95,20 +92,22 @@ class ResultsFrame(ctk.CTkScrollableFrame):
         self.no_results_label = ctk.CTkLabel(
             self.results_container,
             text="No datasets generated yet.\nClick 'Start Generation' to get started!",
-            font=ctk.CTkFont(size=14),
+            font=get_font(size=14),
             text_color="gray"
         )
         self.no_results_label.pack(expand=True)
     
     def display_results(self, results):
-        for widget in self.results_container.winfo_children():
-            widget.destroy()
+        # Replace the whole container: one destroy tears down every previous result widget
+        self.results_container.destroy()
+        self.results_container = ctk.CTkFrame(self, fg_color="transparent")
+        self.results_container.pack(fill="both", expand=True, padx=10)
         
         if not results.get('generated_files'):
             self.no_results_label = ctk.CTkLabel(
                 self.results_container,
                 text="No files were generated.",
-                font=ctk.CTkFont(size=14),
+                font=get_font(size=14),
                 text_color="orange"
             )
             self.no_results_label.pack(expand=True)
@@ -121,7 +120,7 @@ class ResultsFrame(ctk.CTkScrollableFrame):
         summary_title = ctk.CTkLabel(
             summary_frame,
             text="Generation Summary",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=get_font(size=16, weight="bold")
         )
         summary_title.pack(anchor="w", padx=15, pady=(15, 10))
         
@@ -144,7 +143,7 @@ Total Time: {results.get('total_time', 0):.1f}s"""
         files_title = ctk.CTkLabel(
             files_frame,
             text="Generated Files",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=get_font(size=16, weight="bold")
         )
         files_title.pack(anchor="w", padx=15, pady=(15, 10))
         
@@ -168,17 +167,27 @@ Total Time: {results.get('total_time', 0):.1f}s"""
             open_button.pack(side="right", padx=15, pady=5)
     
     def _open_file(self, file_path: str) -> None:
-        import os
+        # Hand off to the desktop opener without waiting, so the Tk loop never blocks on it
         try:
-            os.startfile(file_path)
+            if sys.platform == "win32":
+                os.startfile(file_path)
+            else:
+                opener = "open" if sys.platform == "darwin" else "xdg-open"
+                subprocess.Popen([opener, str(file_path)],
+                                 stdout=subprocess.DEVNULL,
+                                 stderr=subprocess.DEVNULL,
+                                 start_new_session=True)
         except:
             print(f"Cannot open file: {file_path}")
 
 class LogViewer(ctk.CTkTextbox):
+    # Only the end of the log is shown, so startup cost doesn't grow with log history
+    TAIL_BYTES = 256 * 1024
+    
     def __init__(self, parent, **kwargs):
         super().__init__(
             parent,
-            font=ctk.CTkFont(family="Consolas", size=10),
+            font=get_font(family="Consolas", size=10),
             **kwargs
         )
         self.configure(state="disabled")
@@ -188,8 +197,14 @@ class LogViewer(ctk.CTkTextbox):
         try:
             log_file = Path("logs/dataforge.log")
             if log_file.exists():
-                with open(log_file, 'r') as f:
-                    logs = f.read()
+                size = log_file.stat().st_size
+                tail = min(size, self.TAIL_BYTES)
+                with open(log_file, 'rb') as f:
+                    f.seek(size - tail)
+                    data = f.read()
+                # Drop the partial first line before decoding, without copying the buffer
+                start = data.find(b'\n') + 1 if tail < size else 0
+                logs = str(memoryview(data)[start:], 'utf-8', 'replace')
                 self.configure(state="normal")
                 self.insert("1.0", logs)
                 self.see("end")
@@ -204,14 +219,14 @@ class ConfigFrame(ctk.CTkFrame):
         title_label = ctk.CTkLabel(
             self,
             text="Configuration Settings",
-            font=ctk.CTkFont(size=18, weight="bold")
+            font=get_font(size=18, weight="bold")
         )
         title_label.pack(anchor="w", padx=10, pady=(10, 20))
         
         info_label = ctk.CTkLabel(
             self,
             text="Configuration is managed through config.json file",
-            font=ctk.CTkFont(size=12)
+            font=get_font(size=12)
         )
         info_label.pack(anchor="w", padx=10, pady=10)
     
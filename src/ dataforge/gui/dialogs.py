@@ -2,8 +2,30 @@
 import customtkinter as ctk
 import tkinter as tk
 from tkinter import simpledialog, messagebox
-import threading
+import platform
+import psutil
 import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+from dataforge.gui.fonts import get_font
+
+# Reused worker threads for show_busy_dialog operations
+_BUSY_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="dataforge-busy")
+
+# Disk totals barely move at GUI speed; reuse a statvfs result for this long
+DISK_USAGE_TTL = 2.0
+_disk_usage_cache = {}
+
+_ABOUT_TEXT = """
+        DataForge v1.0.0
+        
+        Powered by:
+        - Ollama with Mistral 7B
+        - Kaggle Datasets
+        - Python 3.10+
+
+        """.strip()
 
 class ProgressDialog(ctk.CTkToplevel):
     
@@ -27,7 +49,7 @@ class ProgressDialog(ctk.CTkToplevel):
         self.message_label = ctk.CTkLabel(
             self,
             text=message,
-            font=ctk.CTkFont(size=14)
+            font=get_font(size=14)
         )
         self.message_label.pack(pady=(20, 10), padx=20, anchor="w")
         
@@ -57,7 +79,7 @@ class ProgressDialog(ctk.CTkToplevel):
     
     def update_message(self, new_message):
         self.message_label.configure(text=new_message)
-        self.update()
+        self.update_idletasks()
 
 class SystemInfoDialog(ctk.CTkToplevel):
     
@@ -74,7 +96,7 @@ class SystemInfoDialog(ctk.CTkToplevel):
         title_label = ctk.CTkLabel(
             info_frame,
             text="System Information",
-            font=ctk.CTkFont(size=18, weight="bold")
+            font=get_font(size=18, weight="bold")
         )
         title_label.pack(pady=(10, 20))
         
@@ -83,7 +105,7 @@ class SystemInfoDialog(ctk.CTkToplevel):
         self.info_text = ctk.CTkTextbox(
             info_frame,
             wrap="word",
-            font=ctk.CTkFont(family="Consolas", size=12)
+            font=get_font(family="Consolas", size=12)
         )
         self.info_text.pack(fill="both", expand=True, padx=10, pady=(0, 10))
         self.info_text.insert("1.0", info)
@@ -97,34 +119,66 @@ class SystemInfoDialog(ctk.CTkToplevel):
         close_button.pack(pady=(0, 10))
     
     def _get_system_info(self):
-        import platform
-        import psutil
-        import torch
-        
-        info = []
-        
-        info.append(f"System: {platform.system()} {platform.release()}")
-        info.append(f"Processor: {platform.processor()}")
-        info.append(f"Python: {platform.python_version()}")
-        
+        # Static details are cached; only memory and disk usage are re-queried
         mem = psutil.virtual_memory()
-        info.append(f"RAM: {mem.total / (1024**3):.2f} GB Total, {mem.used / (1024**3):.2f} GB Used")
-        
-        info.append("\nGPU Information:")
-        if torch.cuda.is_available():
-            info.append(f"Device: {torch.cuda.get_device_name(0)}")
-            info.append(f"CUDA Version: {torch.version.cuda}")
-            info.append(f"VRAM: {torch.cuda.get_device_properties(0).total_memory / (1024**3):.2f} GB")
-        else:
-            info.append("No GPU available - Using CPU")
-        
         try:
-            disk = psutil.disk_usage('/')
-            info.append(f"\nDisk: {disk.total / (1024**3):.2f} GB Total, {disk.free / (1024**3):.2f} GB Free")
+            disk = _disk_usage_cached('/')
+            disk_info = _DISK_TEMPLATE.format(total=disk.total / (1024**3), free=disk.free / (1024**3))
         except:
-            pass
+            disk_info = ""
         
-        return "\n".join(info)
+        return _INFO_TEMPLATE.format(
+            static=_static_system_info(),
+            ram_total=mem.total / (1024**3),
+            ram_used=mem.used / (1024**3),
+            disk=disk_info
+        )
+
+_INFO_TEMPLATE = "{static[0]}\nRAM: {ram_total:.2f} GB Total, {ram_used:.2f} GB Used\n{static[1]}{disk}"
+_DISK_TEMPLATE = "\n\nDisk: {total:.2f} GB Total, {free:.2f} GB Free"
+
+def _disk_usage_cached(path='/'):
+    """psutil.disk_usage with a short TTL, bounding statvfs calls however often it is polled"""
+    now = time.monotonic()
+    entry = _disk_usage_cache.get(path)
+    if entry and now - entry[0] < DISK_USAGE_TTL:
+        return entry[1]
+    
+    usage = psutil.disk_usage(path)
+    _disk_usage_cache[path] = (now, usage)
+    return usage
+
+@lru_cache(maxsize=1)
+def _static_system_info():
+    """Platform and GPU blocks, gathered once; platform.processor() and NVML queries are slow"""
+    processor_info = (
+        f"System: {platform.system()} {platform.release()}\n"
+        f"Processor: {platform.processor()}\n"
+        f"Python: {platform.python_version()}"
+    )
+    
+    # NVML reads the device directly, without loading libtorch and the CUDA runtime
+    try:
+        import pynvml
+        pynvml.nvmlInit()
+        try:
+            handle = pynvml.nvmlDeviceGetHandleByIndex(0)
+            name = pynvml.nvmlDeviceGetName(handle)
+            cuda_version = pynvml.nvmlSystemGetCudaDriverVersion()
+            total_memory = pynvml.nvmlDeviceGetMemoryInfo(handle).total
+        finally:
+            pynvml.nvmlShutdown()
+        
+        gpu_info = (
+            "\nGPU Information:\n"
+            f"Device: {name.decode() if isinstance(name, bytes) else name}\n"
+            f"CUDA Version: {cuda_version // 1000}.{cuda_version % 1000 // 10}\n"
+            f"VRAM: {total_memory / (1024**3):.2f} GB"
+        )
+    except Exception:
+        gpu_info = "\nGPU Information:\nNo GPU available - Using CPU"
+    
+    return processor_info, gpu_info
 
 class AboutDialog(ctk.CTkToplevel):
     
@@ -139,29 +193,16 @@ class AboutDialog(ctk.CTkToplevel):
         content_frame = ctk.CTkFrame(self)
         content_frame.pack(fill="both", expand=True, padx=20, pady=20)
         
-        try:
-            logo_label = ctk.CTkLabel(
-                content_frame,
-                text="🔬",
-                font=ctk.CTkFont(size=48)
-            )
-            logo_label.pack(pady=(20, 10))
-        except:
-            pass
-        
-        info_text = """
-        DataForge v1.0.0
-        
-        Powered by:
-        - Ollama with Mistral 7B
-        - Kaggle Datasets
-        - Python 3.10+
-
-        """
+        logo_label = ctk.CTkLabel(
+            content_frame,
+            text="🔬",
+            font=get_font(size=48)
+        )
+        logo_label.pack(pady=(20, 10))
         
         info_label = ctk.CTkLabel(
             content_frame,
-            text=info_text.strip(),
+            text=_ABOUT_TEXT,
             justify="left"
         )
         info_label.pack(pady=10, padx=20)
@@ -173,28 +214,22 @@ class AboutDialog(ctk.CTkToplevel):
         )
         close_button.pack(pady=(10, 20))
 def show_busy_dialog(parent, title, message, operation, *args):
-    result = None
-    exception = None
-    
-    def worker():
-        nonlocal result, exception
-        try:
-            result = operation(*args)
-        except Exception as e:
-            exception = e
-    
-    thread = threading.Thread(target=worker, daemon=True)
-    thread.start()
+    future = _BUSY_POOL.submit(operation, *args)
     
     dialog = ProgressDialog(parent, title, message)
+    done_var = tk.BooleanVar(parent, value=False)
     
-    while thread.is_alive():
-        parent.update()
-        time.sleep(0.1)
+    # Let Tk's event loop wait; the worker can't touch Tk, so check the future on a timer
+    def poll():
+        if future.done():
+            done_var.set(True)
+        else:
+            parent.after(50, poll)
     
-    dialog.destroy()
+    parent.after(50, poll)
+    parent.wait_variable(done_var)
     
-    if exception:
-        raise exception
+    if dialog.winfo_exists():
+        dialog.destroy()
     
-    return result
+    return future.result()
@@ -0,0 +1,7 @@
+import customtkinter as ctk
+from functools import lru_cache
+
+@lru_cache(maxsize=None)
+def get_font(**options) -> ctk.CTkFont:
+    """Shared CTkFont per distinct spec; call only once a Tk root exists"""
+    return ctk.CTkFont(**options)
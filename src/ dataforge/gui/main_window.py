@@ -2,6 +2,7 @@ import customtkinter as ctk
 import tkinter as tk
 from tkinter import messagebox
 import threading
+import queue
 import os
 from pathlib import Path
 import logging
@@ -11,6 +12,31 @@ from typing import Dict, Any
 
 from dataforge.core.dataset_generator import DatasetGenerator
 from dataforge.gui.components import ProgressFrame, StatusBar, ResultsFrame, LogViewer
+from dataforge.gui.fonts import get_font
+
+_API_DOCS_TEXT = """
+GET /api/health
+   Health check and server status
+
+GET /api/datasets  
+   List all generated datasets with download links
+   
+GET /api/download/<keyword>/<filename>
+   Download individual CSV files
+   
+GET /api/download-zip/<keyword>
+   Download all files for a keyword as ZIP
+   
+POST /api/generate
+   Queue dataset generation, returns a job id
+
+GET /api/jobs/<job_id>
+   Poll the status and results of a generation job
+
+Example Usage:
+curl -H "Authorization: Bearer algonomy" \\
+     http://localhost:5000/api/datasets
+        """.strip()
 
 class DataForgeApp:
     
@@ -21,7 +47,6 @@ class DataForgeApp:
         
         self.generator = None
         self.current_keyword = ""
-        self.generation_thread = None
         self.is_generating = False
         self.generation_start_time = None
         
@@ -29,6 +54,20 @@ class DataForgeApp:
         self.rows_var = tk.StringVar(value="500")
         self.variations_var = tk.StringVar(value="6")
         
+        # Latest generator progress/status, written by worker threads and drained on the Tk loop
+        self._ui_lock = threading.Lock()
+        self._latest_progress = None
+        self._latest_status = None
+        
+        # Last options applied per widget by _configure_if_changed
+        self._widget_options = {}
+        
+        # One long-lived worker runs generation jobs; finished callbacks are drained on the Tk loop
+        self._work_q = queue.Queue()
+        self._done_q = queue.Queue()
+        self._worker = threading.Thread(target=self._worker_loop, name="dataforge-generation", daemon=True)
+        self._worker.start()
+        
         # Setup GUI
         self._setup_window()
         self._create_widgets()
@@ -37,6 +76,7 @@ class DataForgeApp:
         
         # Initialize generator
         self._initialize_generator()
+        self.root.after(33, self._drain_ui)
         
         self.logger.info("DataForge GUI initialized successfully")
     
@@ -56,16 +96,16 @@ class DataForgeApp:
         self.title_label = ctk.CTkLabel(
             self.header_frame,
             text="🔬 DataForge ",
-            font=ctk.CTkFont(size=32, weight="bold")
+            font=get_font(size=32, weight="bold")
         )
         self.subtitle_label = ctk.CTkLabel(
             self.header_frame,
             text="Synthetic Dataset Generator",
-            font=ctk.CTkFont(size=16)
+            font=get_font(size=16)
         )
         
         # Create tabview (without configuration tab)
-        self.tabview = ctk.CTkTabview(self.main_frame)
+        self.tabview = ctk.CTkTabview(self.main_frame, command=self._on_tab_changed)
         
         # Add tabs
         self.generation_tab = self.tabview.add("Generation")
@@ -76,15 +116,25 @@ class DataForgeApp:
         # Set default tab
         self.tabview.set("Generation")
         
-        # Create content
+        # Create content; other tabs are built the first time they're shown
         self._create_generation_content()
-        self._create_results_content()
-        self._create_api_content()
-        self._create_logs_content()
+        self._pending_tabs = {
+            "Results": self._create_results_content,
+            "API Access": self._create_api_content,
+            "Logs": self._create_logs_content
+        }
         
         # Status bar
         self.status_bar = StatusBar(self.main_frame)
     
+    def _on_tab_changed(self) -> None:
+        self._ensure_tab(self.tabview.get())
+    
+    def _ensure_tab(self, name: str) -> None:
+        builder = self._pending_tabs.pop(name, None)
+        if builder:
+            builder()
+    
     def _create_generation_content(self):
         container = ctk.CTkFrame(self.generation_tab)
         container.pack(fill="both", expand=True, padx=20, pady=20)
@@ -96,105 +146,98 @@ class DataForgeApp:
         title_label = ctk.CTkLabel(
             title_frame,
             text="Synthetic Dataset Generation",
-            font=ctk.CTkFont(size=24, weight="bold")
+            font=get_font(size=24, weight="bold")
         )
         title_label.pack(side="left", pady=15)
         
         api_indicator = ctk.CTkLabel(
             title_frame,
             text=" API Ready",
-            font=ctk.CTkFont(size=12, weight="bold"),
+            font=get_font(size=12, weight="bold"),
             text_color="green"
         )
         api_indicator.pack(side="right", pady=15)
         
-        # Input section
+        # Input section: one grid holds the keyword, settings and their labels
         input_frame = ctk.CTkFrame(container)
         input_frame.pack(fill="x", padx=20, pady=(0, 20))
+        input_frame.grid_columnconfigure(4, weight=1)
         
         keyword_label = ctk.CTkLabel(
             input_frame,
             text="Domain Keyword:",
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=get_font(size=14, weight="bold")
         )
-        keyword_label.pack(anchor="w", padx=20, pady=(20, 5))
+        keyword_label.grid(row=0, column=0, columnspan=5, padx=20, pady=(20, 5), sticky="w")
         
         self.keyword_entry = ctk.CTkEntry(
             input_frame,
             placeholder_text="e.g., healthcare, finance, education, retail",
-            font=ctk.CTkFont(size=14),
+            font=get_font(size=14),
             height=40
         )
-        self.keyword_entry.pack(fill="x", padx=20, pady=(0, 20))
+        self.keyword_entry.grid(row=1, column=0, columnspan=5, padx=20, pady=(0, 20), sticky="ew")
         
         # Enhanced settings
-        settings_frame = ctk.CTkFrame(input_frame)
-        settings_frame.pack(fill="x", padx=20, pady=(0, 20))
-        
         settings_label = ctk.CTkLabel(
-            settings_frame,
+            input_frame,
             text=" Generation Settings",
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=get_font(size=14, weight="bold")
         )
-        settings_label.pack(anchor="w", padx=15, pady=(15, 10))
-        
-        settings_grid = ctk.CTkFrame(settings_frame)
-        settings_grid.pack(padx=15, pady=(0, 15))
+        settings_label.grid(row=2, column=0, columnspan=5, padx=20, pady=(0, 10), sticky="w")
         
         # Rows setting
-        rows_label = ctk.CTkLabel(settings_grid, text="Rows per dataset:")
-        rows_label.grid(row=0, column=0, padx=15, pady=10, sticky="w")
+        rows_label = ctk.CTkLabel(input_frame, text="Rows per dataset:")
+        rows_label.grid(row=3, column=0, padx=(35, 15), pady=(0, 20), sticky="w")
         
-        self.rows_entry = ctk.CTkEntry(settings_grid, textvariable=self.rows_var, width=120)
-        self.rows_entry.grid(row=0, column=1, padx=15, pady=10)
+        self.rows_entry = ctk.CTkEntry(input_frame, textvariable=self.rows_var, width=120)
+        self.rows_entry.grid(row=3, column=1, padx=15, pady=(0, 20))
         
         # Variations setting
-        variations_label = ctk.CTkLabel(settings_grid, text="🔄 Variations:")
-        variations_label.grid(row=0, column=2, padx=15, pady=10, sticky="w")
+        variations_label = ctk.CTkLabel(input_frame, text="🔄 Variations:")
+        variations_label.grid(row=3, column=2, padx=15, pady=(0, 20), sticky="w")
         
-        self.variations_entry = ctk.CTkEntry(settings_grid, textvariable=self.variations_var, width=120)
-        self.variations_entry.grid(row=0, column=3, padx=15, pady=10)
+        self.variations_entry = ctk.CTkEntry(input_frame, textvariable=self.variations_var, width=120)
+        self.variations_entry.grid(row=3, column=3, padx=15, pady=(0, 20))
         
-        # Control buttons
+        # Control buttons, centred between two weighted spacer columns
         button_frame = ctk.CTkFrame(container)
         button_frame.pack(fill="x", padx=20, pady=(0, 20))
+        button_frame.grid_columnconfigure((0, 3), weight=1)
         
         control_label = ctk.CTkLabel(
             button_frame,
             text="🎮 Generation Control",
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=get_font(size=14, weight="bold")
         )
-        control_label.pack(anchor="w", padx=20, pady=(20, 10))
-        
-        btn_container = ctk.CTkFrame(button_frame)
-        btn_container.pack(pady=(0, 20))
+        control_label.grid(row=0, column=0, columnspan=4, padx=20, pady=(20, 10), sticky="w")
         
         # START BUTTON
         self.start_btn = ctk.CTkButton(
-            btn_container,
+            button_frame,
             text="START ENHANCED GENERATION",
             command=self._start_generation,
             height=50,
             width=280,
-            font=ctk.CTkFont(size=16, weight="bold"),
+            font=get_font(size=16, weight="bold"),
             fg_color="#28a745",
             hover_color="#218838"
         )
-        self.start_btn.pack(side="left", padx=15, pady=15)
+        self.start_btn.grid(row=1, column=1, padx=15, pady=(0, 20))
         
         # STOP BUTTON
         self.stop_btn = ctk.CTkButton(
-            btn_container,
+            button_frame,
             text="⏹ STOP GENERATION",
             command=self._stop_generation,
             height=50,
             width=200,
-            font=ctk.CTkFont(size=16, weight="bold"),
+            font=get_font(size=16, weight="bold"),
             fg_color="#dc3545",
             hover_color="#c82333",
             state="disabled"
         )
-        self.stop_btn.pack(side="left", padx=15, pady=15)
+        self.stop_btn.grid(row=1, column=2, padx=15, pady=(0, 20))
         
         # Progress section
         progress_container = ctk.CTkFrame(container)
@@ -215,7 +258,7 @@ class DataForgeApp:
         title_label = ctk.CTkLabel(
             container,
             text="API Access & Documentation",
-            font=ctk.CTkFont(size=24, weight="bold")
+            font=get_font(size=24, weight="bold")
         )
         title_label.pack(pady=(20, 15))
         
@@ -226,14 +269,14 @@ class DataForgeApp:
         status_label = ctk.CTkLabel(
             status_frame,
             text="API Server Status",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=get_font(size=16, weight="bold")
         )
         status_label.pack(anchor="w", padx=15, pady=(15, 10))
         
         self.api_status_label = ctk.CTkLabel(
             status_frame,
             text="API Server Running on http://localhost:5000",
-            font=ctk.CTkFont(size=12),
+            font=get_font(size=12),
             text_color="green"
         )
         self.api_status_label.pack(anchor="w", padx=15, pady=(0, 10))
@@ -242,10 +285,10 @@ class DataForgeApp:
         key_frame = ctk.CTkFrame(status_frame)
         key_frame.pack(fill="x", padx=15, pady=(0, 15))
         
-        key_label = ctk.CTkLabel(key_frame, text=" API Key:", font=ctk.CTkFont(weight="bold"))
+        key_label = ctk.CTkLabel(key_frame, text=" API Key:", font=get_font(weight="bold"))
         key_label.pack(anchor="w", padx=10, pady=(10, 5))
         
-        key_text = ctk.CTkTextbox(key_frame, height=40, font=ctk.CTkFont(family="Consolas", size=12))
+        key_text = ctk.CTkTextbox(key_frame, height=40, font=get_font(family="Consolas", size=12))
         key_text.pack(fill="x", padx=10, pady=(0, 10))
         key_text.insert("1.0", "algonomy")
         key_text.configure(state="disabled")
@@ -257,7 +300,7 @@ class DataForgeApp:
         actions_label = ctk.CTkLabel(
             actions_frame,
             text="Quick Actions",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=get_font(size=16, weight="bold")
         )
         actions_label.pack(anchor="w", padx=15, pady=(15, 10))
         
@@ -292,38 +335,18 @@ class DataForgeApp:
         docs_label = ctk.CTkLabel(
             docs_frame,
             text="API Endpoints",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=get_font(size=16, weight="bold")
         )
         docs_label.pack(anchor="w", padx=15, pady=(15, 10))
         
-        docs_text = """
-GET /api/health
-   Health check and server status
-
-GET /api/datasets  
-   List all generated datasets with download links
-   
-GET /api/download/<keyword>/<filename>
-   Download individual CSV files
-   
-GET /api/download-zip/<keyword>
-   Download all files for a keyword as ZIP
-   
-POST /api/generate
-   Trigger dataset generation programmatically
-
-Example Usage:
-curl -H "Authorization: Bearer algonomy" \\
-     http://localhost:5000/api/datasets
-        """
-        
         docs_textbox = ctk.CTkTextbox(
             docs_frame,
-            font=ctk.CTkFont(family="Consolas", size=11)
+            font=get_font(family="Consolas", size=11)
         )
-        docs_textbox.pack(fill="both", expand=True, padx=15, pady=(0, 15))
-        docs_textbox.insert("1.0", docs_text.strip())
+        # Fill and lock the text before packing, so it is drawn once when mapped
+        docs_textbox.insert("1.0", _API_DOCS_TEXT)
         docs_textbox.configure(state="disabled")
+        docs_textbox.pack(fill="both", expand=True, padx=15, pady=(0, 15))
     
     def _create_logs_content(self):
         logs_frame = ctk.CTkFrame(self.logs_tab)
@@ -332,7 +355,7 @@ curl -H "Authorization: Bearer algonomy" \\
         logs_title = ctk.CTkLabel(
             logs_frame,
             text="System Logs",
-            font=ctk.CTkFont(size=18, weight="bold")
+            font=get_font(size=18, weight="bold")
         )
         logs_title.pack(pady=(20, 10))
         
@@ -349,7 +372,7 @@ curl -H "Authorization: Bearer algonomy" \\
     
     def _setup_bindings(self) -> None:
         self.root.protocol("WM_DELETE_WINDOW", self._on_closing)
-        self.keyword_entry.bind("<Return>", lambda e: self._start_generation())
+        self.keyword_entry.bind("<Return>", self._start_generation_event)
     
     def _initialize_generator(self) -> None:
         try:
@@ -368,16 +391,57 @@ curl -H "Authorization: Bearer algonomy" \\
             messagebox.showerror("Initialization Error", f"Failed to initialize DataForge:\n{e}")
 
     def _progress_callback(self, value: float, message: str) -> None:
-        if self.is_generating and self.generation_start_time:
-            elapsed = time.time() - self.generation_start_time
-            info = f"Elapsed: {elapsed:.1f}s"
-        else:
-            info = ""
-        
-        self.progress_frame.update_progress(value, message, info)
+        if not self.is_generating:
+            return  # a stopped run winding down
+        with self._ui_lock:
+            # Keep the last non-empty message if a newer update has none
+            if not message and self._latest_progress:
+                message = self._latest_progress[1]
+            self._latest_progress = (value, message)
 
     def _status_callback(self, message: str) -> None:
-        self.status_bar.set_status(message)
+        if not self.is_generating:
+            return
+        with self._ui_lock:
+            self._latest_status = message
+    
+    def _drain_ui(self) -> None:
+        """Render only the newest generator progress/status, at most ~30 times a second"""
+        try:
+            with self._ui_lock:
+                progress, self._latest_progress = self._latest_progress, None
+                status, self._latest_status = self._latest_status, None
+            
+            if progress is not None:
+                if self.is_generating and self.generation_start_time:
+                    elapsed = time.time() - self.generation_start_time
+                    info = f"Elapsed: {elapsed:.1f}s"
+                else:
+                    info = ""
+                self.progress_frame.update_progress(*progress, info)
+            if status is not None:
+                self.status_bar.set_status(status)
+            
+            while True:
+                try:
+                    callback, arg = self._done_q.get_nowait()
+                except queue.Empty:
+                    break
+                callback(arg)
+        finally:
+            # Keep pumping even if a widget update or completion callback raised
+            self.root.after(33, self._drain_ui)
+    
+    def _configure_if_changed(self, widget, **options) -> None:
+        """configure() only the options that differ from what was last set, skipping no-op Tcl calls"""
+        current = self._widget_options.setdefault(widget, {})
+        delta = {k: v for k, v in options.items() if current.get(k) != v}
+        if delta:
+            widget.configure(**delta)
+            current.update(delta)
+    
+    def _start_generation_event(self, _event=None):
+        self._start_generation()
     
     def _start_generation(self):
         if self.is_generating:
@@ -400,8 +464,8 @@ curl -H "Authorization: Bearer algonomy" \\
             messagebox.showerror("Error", f"Invalid input: {e}")
             return
         
-        self.start_btn.configure(state="disabled", fg_color="#666666")
-        self.stop_btn.configure(state="normal", fg_color="#dc3545")
+        self._configure_if_changed(self.start_btn, state="disabled", fg_color="#666666")
+        self._configure_if_changed(self.stop_btn, state="normal", fg_color="#dc3545")
         
         self.progress_frame.reset()
         
@@ -410,13 +474,8 @@ curl -H "Authorization: Bearer algonomy" \\
         self.current_keyword = keyword
         self.generation_start_time = time.time()
         
-        # Start generation thread
-        self.generation_thread = threading.Thread(
-            target=self._run_generation,
-            args=(keyword, rows, variations),
-            daemon=True
-        )
-        self.generation_thread.start()
+        # Hand the job to the generation worker
+        self._work_q.put((self._run_generation, (keyword, rows, variations)))
         
         self.logger.info(f" Started enhanced generation: {keyword}")
 
@@ -428,8 +487,13 @@ curl -H "Authorization: Bearer algonomy" \\
             self.generator.should_stop = True
         
         # Reset button states
-        self.start_btn.configure(state="normal", fg_color="#28a745")
-        self.stop_btn.configure(state="disabled", fg_color="#666666")
+        self._configure_if_changed(self.start_btn, state="normal", fg_color="#28a745")
+        self._configure_if_changed(self.stop_btn, state="disabled", fg_color="#666666")
+        
+        # Drop queued worker updates so the next drain doesn't overwrite the stop message
+        with self._ui_lock:
+            self._latest_progress = None
+            self._latest_status = None
         
         # Update progress
         self.progress_frame.update_progress(0, "⏹ Generation stopped by user")
@@ -439,6 +503,14 @@ curl -H "Authorization: Bearer algonomy" \\
         
         self.logger.info("⏹ Generation stopped by user")
 
+    def _worker_loop(self):
+        while True:
+            fn, args = self._work_q.get()
+            try:
+                fn(*args)
+            except Exception as e:
+                self.logger.exception(f"Background job failed: {e}")
+
     def _run_generation(self, keyword, rows, variations):
         try:
             results = self.generator.generate_datasets(
@@ -447,20 +519,21 @@ curl -H "Authorization: Bearer algonomy" \\
                 num_variations=variations
             )
             
-            self.root.after(0, lambda: self._on_generation_complete(results))
+            self._done_q.put((self._on_generation_complete, results))
             
         except Exception as e:
-            self.root.after(0, lambda: self._on_generation_error(e))
+            self._done_q.put((self._on_generation_error, e))
 
     def _on_generation_complete(self, results):
         # Reset button states
-        self.start_btn.configure(state="normal", fg_color="#28a745")
-        self.stop_btn.configure(state="disabled", fg_color="#666666")
+        self._configure_if_changed(self.start_btn, state="normal", fg_color="#28a745")
+        self._configure_if_changed(self.stop_btn, state="disabled", fg_color="#666666")
         
         # Update progress
         self.progress_frame.update_progress(1.0, " Generation completed successfully!")
         
         # Display results with API info
+        self._ensure_tab("Results")
         self.results_frame.display_results(results)
         self.tabview.set("Results")
         
@@ -475,15 +548,19 @@ curl -H "Authorization: Bearer algonomy" \\
             message += f"Base URL: {api_info.get('base_url', 'http://localhost:5000')}\n"
             message += f"Download ZIP: {api_info.get('endpoints', {}).get('download_zip', 'N/A')}\n"
             message += f"API Key: {api_info.get('api_key', 'algonomy')}"
-            
+        
+        # All widget changes above are queued as idle work; paint them in one pass before the modal
+        self.root.update_idletasks()
+        
+        if files_created > 0:
             messagebox.showinfo("Generation Complete", message)
         else:
             messagebox.showwarning(" Warning", "No files were generated. Check logs for details.")
 
     def _on_generation_error(self, error):
         # Reset button states
-        self.start_btn.configure(state="normal", fg_color="#28a745")
-        self.stop_btn.configure(state="disabled", fg_color="#666666")
+        self._configure_if_changed(self.start_btn, state="normal", fg_color="#28a745")
+        self._configure_if_changed(self.stop_btn, state="disabled", fg_color="#666666")
         
         # Update progress
         self.progress_frame.update_progress(0, f"❌ Error: {str(error)}")
@@ -491,6 +568,7 @@ curl -H "Authorization: Bearer algonomy" \\
         # Reset state
         self.is_generating = False
         
+        self.root.update_idletasks()
         messagebox.showerror("❌ Generation Error", f"Generation failed: {str(error)}")
     
     def _copy_api_key(self):
@@ -2,10 +2,24 @@ import os
 import logging
 from pathlib import Path
 from typing import Dict, Any, List
+import numpy as np
 import pandas as pd
 
 logger = logging.getLogger(__name__)
 
+_FALLBACK_CATEGORIES = np.array([f'category_{i}' for i in range(5)])
+_FALLBACK_STATUSES = np.array(['active', 'inactive'])
+
+def _iter_csv_files(root, depth: int = 0):
+    """Yield (path, size, depth) for every CSV under root, using one scandir pass per directory"""
+    with os.scandir(root) as it:
+        for entry in it:
+            if entry.is_file(follow_symlinks=False):
+                if entry.name.endswith('.csv'):
+                    yield Path(entry.path), entry.stat().st_size, depth
+            elif entry.is_dir(follow_symlinks=False):
+                yield from _iter_csv_files(entry.path, depth + 1)
+
 class KaggleDatasetHandler:
     def __init__(self, config: Dict[str, Any]):
         self.config = config
@@ -74,10 +88,11 @@ class KaggleDatasetHandler:
                 quiet=True
             )
             
-            # Find CSV files
-            csv_files = list(output_dir.glob('*.csv'))
-            if not csv_files:
-                csv_files = list(output_dir.glob('**/*.csv'))
+            # Find CSV files, preferring ones at the top of the download
+            top_level, nested = [], []
+            for path, size, depth in _iter_csv_files(output_dir):
+                (nested if depth else top_level).append((path, size))
+            csv_files = top_level or nested
             
             if not csv_files:
                 # Create a fallback CSV file
@@ -85,7 +100,7 @@ class KaggleDatasetHandler:
                 self._create_fallback_csv(fallback_file)
                 return fallback_file
             
-            main_file = max(csv_files, key=lambda f: f.stat().st_size)
+            main_file = max(csv_files, key=lambda entry: entry[1])[0]
             logger.info(f"Downloaded dataset to: {main_file}")
             return main_file
             
@@ -96,16 +111,18 @@ class KaggleDatasetHandler:
             self._create_fallback_csv(fallback_file)
             return fallback_file
     
-    def _create_fallback_csv(self, file_path: Path):
-        import random
+    def _create_fallback_csv(self, file_path: Path, num_rows: int = 100):
+        rng = np.random.default_rng()
         
         data = {
-            'id': range(1, 101),
-            'value': [random.randint(1, 1000) for _ in range(100)],
-            'category': [f'category_{i%5}' for i in range(100)],
-            'status': [random.choice(['active', 'inactive']) for _ in range(100)]
+            'id': np.arange(1, num_rows + 1),
+            'value': rng.integers(1, 1001, size=num_rows),
+            'category': _FALLBACK_CATEGORIES[np.arange(num_rows) % 5],
+            'status': rng.choice(_FALLBACK_STATUSES, size=num_rows)
         }
         
         df = pd.DataFrame(data)
-        df.to_csv(file_path, index=False)
+        # Binary handle with a fixed terminator skips text-mode newline translation
+        with open(file_path, 'wb') as f:
+            df.to_csv(f, index=False, lineterminator='\n')
         logger.info(f"Created fallback CSV: {file_path}")
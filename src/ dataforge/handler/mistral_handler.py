@@ -1,211 +1,290 @@
+import csv
+import io
 import logging
-import random
-import re
-from typing import Dict, List
+import string
+import time
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Callable, Dict, List, Tuple
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
-class MistralHandler:
-    def __init__(self, config):
-        self.config = config
-        self.model_name = config.get('model_name', 'mistral')
-        self.max_tokens = config.get('max_tokens', 2000)
-        self.temperature = config.get('temperature', 0.7)
-        
-        self.prompt_templates = {
-            'healthcare': self._get_healthcare_template(),
-            'finance': self._get_finance_template(),
-            'education': self._get_education_template(),
-            'retail': self._get_retail_template(),
-            'default': self._get_default_template()
-        }
-        
-        self._verify_ollama()
-    
-    def _verify_ollama(self):
-        try:
-            import ollama
-            models = ollama.list()
-            available = [m.get('name', '') for m in models.get('models', [])]
-            
-            if any(self.model_name in name for name in available):
-                logger.info(f"Verified Ollama model: {self.model_name}")
-                self.ollama = ollama
-                self.available = True
-            else:
-                logger.warning(f"Model {self.model_name} not found, using fallback")
-                self.ollama = None
-                self.available = False
-        except Exception as e:
-            logger.error(f"Ollama verification failed: {e}")
-            self.ollama = None
-            self.available = False
-    
-    def generate(self, schema: Dict, num_rows: int, keyword: str = "") -> str:
-        
-        template_key = keyword.lower() if keyword.lower() in self.prompt_templates else 'default'
-        template = self.prompt_templates[template_key]
-        
-        prompt = self._build_enhanced_prompt(schema, num_rows, template, keyword)
-        
-        if self.available and self.ollama:
-            try:
-                response = self.ollama.generate(
-                    model=self.model_name,
-                    prompt=prompt,
-                    options={
-                        'num_predict': self.max_tokens,
-                        'temperature': self.temperature,
-                        'top_p': 0.9,
-                        'repeat_penalty': 1.1
-                    }
-                )
-                result = response.get('response', '')
-                if result and len(result.strip()) > 50:
-                    cleaned = self._clean_and_validate_csv(result, schema)
-                    if cleaned:
-                        return cleaned
-            except Exception as e:
-                logger.error(f"Ollama generation failed: {e}")
+_MONTHS = tuple(f"{m:02d}" for m in range(1, 13))
+_DAYS = tuple(f"{d:02d}" for d in range(1, 29))
+_MONTH_PREFIXES = np.array([f"2024-{m}-" for m in _MONTHS])
+_DAY_SUFFIXES = np.array(_DAYS)
+
+_ALNUM = frozenset(string.ascii_letters + string.digits)
+
+class _CsvSafeTable(dict):
+    """str.translate table keeping ASCII alphanumerics, ',.-_@' and whitespace; fills lazily for any code point"""
+    def __missing__(self, code):
+        char = chr(code)
+        value = code if char in _ALNUM or char in ',.-_@' or char.isspace() else None
+        self[code] = value
+        return value
+
+_CSV_SAFE = _CsvSafeTable()
+
+# Column names that pin a prompt spec regardless of dtype
+_INT_NAMES = frozenset({'id', 'age', 'count', 'number'})
+_FLOAT_NAMES = frozenset({'price', 'amount', 'rate', 'score'})
+_DATE_NAMES = frozenset({'date', 'time', 'created', 'updated'})
+_CONTACT_NAMES = frozenset({'email', 'phone', 'address'})
+
+@lru_cache(maxsize=64)
+def _render_prompt_skeleton(schema_key: Tuple, keyword: str, context: str,
+                            quality_requirements: str, example: str) -> Tuple[str, ...]:
+    """Prompt text split around each row-count slot; rejoin with str(num_rows)"""
+    column_specs = []
+    for col_name, col_type, sample_val in schema_key:
+        name_l = col_name.lower()
+        dtype_l = col_type.lower()
+        if 'int' in dtype_l or name_l in _INT_NAMES:
+            spec = f"{col_name}: integer values (like {sample_val})"
+        elif 'float' in dtype_l or name_l in _FLOAT_NAMES:
+            spec = f"{col_name}: decimal values (like {sample_val})"
+        elif name_l in _DATE_NAMES:
+            spec = f"{col_name}: date/time values (format like {sample_val})"
+        elif name_l in _CONTACT_NAMES:
+            spec = f"{col_name}: realistic {name_l} format"
+        else:
+            spec = f"{col_name}: text values (like {sample_val})"
         
-        # Enhanced fallback generation
-        return self._generate_enhanced_fallback(schema, num_rows, keyword)
+        column_specs.append(spec)
     
-    def _build_enhanced_prompt(self, schema: Dict, num_rows: int, template: Dict, keyword: str) -> str:
-        
-        columns = schema.get('columns', [])
-        sample_data = schema.get('sample_data', {})
-        
-        column_specs = []
-        for col in columns:
-            col_name = col['name']
-            col_type = col['dtype']
-            sample_val = sample_data.get(col_name, '')
-            
-            if 'int' in col_type.lower() or col_name.lower() in ['id', 'age', 'count', 'number']:
-                spec = f"{col_name}: integer values (like {sample_val})"
-            elif 'float' in col_type.lower() or col_name.lower() in ['price', 'amount', 'rate', 'score']:
-                spec = f"{col_name}: decimal values (like {sample_val})"
-            elif col_name.lower() in ['date', 'time', 'created', 'updated']:
-                spec = f"{col_name}: date/time values (format like {sample_val})"
-            elif col_name.lower() in ['email', 'phone', 'address']:
-                spec = f"{col_name}: realistic {col_name.lower()} format"
-            else:
-                spec = f"{col_name}: text values (like {sample_val})"
-            
-            column_specs.append(spec)
-        
-        prompt = f"""You are an expert synthetic data generator specializing in {keyword} domain data.
+    head = f"""You are an expert synthetic data generator specializing in {keyword} domain data.
 
-TASK: Generate exactly {num_rows} rows of realistic CSV data.
+TASK: Generate exactly """
+    middle = f""" rows of realistic CSV data.
 
-DOMAIN CONTEXT: {template['context']}
+DOMAIN CONTEXT: {context}
 
 COLUMN SPECIFICATIONS:
 {chr(10).join(f"- {spec}" for spec in column_specs)}
 
 DATA QUALITY REQUIREMENTS:
-{template['quality_requirements']}
+{quality_requirements}
 
 OUTPUT FORMAT:
-- Start with header row: {','.join(col['name'] for col in columns)}
-- Follow with exactly {num_rows} data rows
+- Start with header row: {','.join(col[0] for col in schema_key)}
+- Follow with exactly """
+    tail = f""" data rows
 - Use proper CSV formatting (comma-separated, no extra quotes unless needed)
 
 EXAMPLE STRUCTURE:
-{template['example']}
+{example}
 
 Generate the CSV data now:"""
-
-        return prompt
     
-    def _get_healthcare_template(self) -> Dict:
-        return {
-            'context': "Healthcare and medical data with patient records, treatments, and medical terminology. Focus on realistic medical scenarios while maintaining privacy.",
-            'quality_requirements': """
+    return head, middle, tail
+
+# Read-only prompt templates shared by every handler
+_HEALTHCARE_TEMPLATE = MappingProxyType({
+    'context': "Healthcare and medical data with patient records, treatments, and medical terminology. Focus on realistic medical scenarios while maintaining privacy.",
+    'quality_requirements': """
 - Use realistic medical terminology and codes
 - Maintain logical relationships (age vs conditions)
 - Include diverse demographic representation
 - Follow medical data standards (ICD codes, etc.)
 - Ensure temporal consistency in dates""",
-            'example': "patient_id,age,gender,diagnosis,treatment_cost,admission_date\n1001,45,Female,Hypertension,2500.50,2024-01-15"
-        }
-    
-    def _get_finance_template(self) -> Dict:
-        return {
-            'context': "Financial and banking data including transactions, accounts, and market data. Focus on realistic financial patterns and regulations.",
-            'quality_requirements': """
+    'example': "patient_id,age,gender,diagnosis,treatment_cost,admission_date\n1001,45,Female,Hypertension,2500.50,2024-01-15"
+})
+
+_FINANCE_TEMPLATE = MappingProxyType({
+    'context': "Financial and banking data including transactions, accounts, and market data. Focus on realistic financial patterns and regulations.",
+    'quality_requirements': """
 - Use realistic financial amounts and ranges
 - Maintain transaction balance logic
 - Include diverse account types and statuses
 - Follow financial data formats (currency, percentages)
 - Ensure regulatory compliance patterns""",
-            'example': "account_id,balance,transaction_type,amount,date\nACC001,15000.75,credit,1200.00,2024-01-15"
-        }
-    
-    def _get_education_template(self) -> Dict:
-        return {
-            'context': "Educational data including students, courses, grades, and academic performance. Focus on realistic academic scenarios.",
-            'quality_requirements': """
+    'example': "account_id,balance,transaction_type,amount,date\nACC001,15000.75,credit,1200.00,2024-01-15"
+})
+
+_EDUCATION_TEMPLATE = MappingProxyType({
+    'context': "Educational data including students, courses, grades, and academic performance. Focus on realistic academic scenarios.",
+    'quality_requirements': """
 - Use realistic grade ranges and academic terms
 - Maintain logical course-grade relationships
 - Include diverse student demographics
 - Follow academic calendar patterns
 - Ensure grade progression consistency""",
-            'example': "student_id,course_name,grade,credits,semester\nSTU001,Mathematics,85.5,3,Fall2024"
-        }
-    
-    def _get_retail_template(self) -> Dict:
-        return {
-            'context': "Retail and e-commerce data including products, sales, and customer transactions. Focus on realistic shopping patterns.",
-            'quality_requirements': """
+    'example': "student_id,course_name,grade,credits,semester\nSTU001,Mathematics,85.5,3,Fall2024"
+})
+
+_RETAIL_TEMPLATE = MappingProxyType({
+    'context': "Retail and e-commerce data including products, sales, and customer transactions. Focus on realistic shopping patterns.",
+    'quality_requirements': """
 - Use realistic product names and categories
 - Maintain logical price-quantity relationships
 - Include seasonal shopping patterns
 - Follow retail data standards
 - Ensure inventory consistency""",
-            'example': "product_id,product_name,category,price,stock_quantity\nPRD001,Wireless Headphones,Electronics,89.99,150"
-        }
-    
-    def _get_default_template(self) -> Dict:
-        return {
-            'context': "General business data with realistic patterns and relationships appropriate for the specified domain.",
-            'quality_requirements': """
+    'example': "product_id,product_name,category,price,stock_quantity\nPRD001,Wireless Headphones,Electronics,89.99,150"
+})
+
+_DEFAULT_TEMPLATE = MappingProxyType({
+    'context': "General business data with realistic patterns and relationships appropriate for the specified domain.",
+    'quality_requirements': """
 - Use realistic and consistent data values
 - Maintain logical relationships between columns
 - Include appropriate data distributions
 - Follow common data standards and formats
 - Ensure data quality and completeness""",
-            'example': "id,name,category,value,status\n1,Sample Item,Category A,100.0,active"
+    'example': "id,name,category,value,status\n1,Sample Item,Category A,100.0,active"
+})
+
+# Read-only value pools for the fallback generators, shared across calls
+_HEALTH_GENERATORS = MappingProxyType({
+    'names': ('John Smith', 'Sarah Johnson', 'Michael Brown', 'Emily Davis', 'David Wilson'),
+    'conditions': ('Hypertension', 'Diabetes', 'Asthma', 'Arthritis', 'Migraine'),
+    'departments': ('Cardiology', 'Neurology', 'Orthopedics', 'Pediatrics', 'Emergency')
+})
+
+_FINANCE_GENERATORS = MappingProxyType({
+    'names': ('Alice Cooper', 'Bob Johnson', 'Carol White', 'David Lee', 'Eva Martinez'),
+    'account_types': ('Checking', 'Savings', 'Credit', 'Investment', 'Loan'),
+    'transaction_types': ('Deposit', 'Withdrawal', 'Transfer', 'Payment', 'Fee')
+})
+
+_EDUCATION_GENERATORS = MappingProxyType({
+    'names': ('Alex Chen', 'Maria Garcia', 'James Kim', 'Lisa Wang', 'Tom Anderson'),
+    'courses': ('Mathematics', 'Science', 'English', 'History', 'Art'),
+    'majors': ('Computer Science', 'Biology', 'Business', 'Psychology', 'Engineering')
+})
+
+_DEFAULT_GENERATORS = MappingProxyType({
+    'names': ('Person A', 'Person B', 'Person C', 'Person D', 'Person E'),
+    'categories': ('Category 1', 'Category 2', 'Category 3', 'Category 4', 'Category 5'),
+    'statuses': ('Active', 'Inactive', 'Pending', 'Completed', 'Cancelled')
+})
+
+# Probe result per model name as (Ollama module or None, monotonic expiry). A found
+# model is kept for the process lifetime; a failure is retried after a short TTL so
+# starting Ollama or pulling the model later is still picked up
+_PROBE_RESULTS = {}
+_PROBE_FAILURE_TTL = 60.0
+
+def _probe_ollama(model_name: str):
+    """Ollama module if model_name is installed, else None; cached per process"""
+    cached = _PROBE_RESULTS.get(model_name)
+    if cached is not None and time.monotonic() < cached[1]:
+        return cached[0]
+    
+    try:
+        import ollama
+        models = ollama.list()
+        available = [m.get('name', '') for m in models.get('models', [])]
+        
+        if any(model_name in name for name in available):
+            logger.info(f"Verified Ollama model: {model_name}")
+            _PROBE_RESULTS[model_name] = (ollama, float('inf'))
+            return ollama
+        
+        logger.warning(f"Model {model_name} not found, using fallback")
+    except Exception as e:
+        logger.error(f"Ollama verification failed: {e}")
+    _PROBE_RESULTS[model_name] = (None, time.monotonic() + _PROBE_FAILURE_TTL)
+    return None
+
+class MistralHandler:
+    def __init__(self, config):
+        self.config = config
+        self.model_name = config.get('model_name', 'mistral')
+        self.max_tokens = config.get('max_tokens', 2000)
+        self.temperature = config.get('temperature', 0.7)
+        
+        self.prompt_templates = {
+            'healthcare': _HEALTHCARE_TEMPLATE,
+            'finance': _FINANCE_TEMPLATE,
+            'education': _EDUCATION_TEMPLATE,
+            'retail': _RETAIL_TEMPLATE,
+            'default': _DEFAULT_TEMPLATE
         }
+        
+        self._verify_ollama()
+    
+    def _verify_ollama(self):
+        self.ollama = _probe_ollama(self.model_name)
+        self.available = self.ollama is not None
+    
+    def generate(self, schema: Dict, num_rows: int, keyword: str = "") -> str:
+        return self.generate_with_source(schema, num_rows, keyword)[0]
+    
+    def generate_with_source(self, schema: Dict, num_rows: int, keyword: str = "") -> Tuple[str, bool]:
+        """Generated CSV text, and whether it came from the model rather than the local fallback"""
+        if self.available and self.ollama:
+            template = self.prompt_templates.get(keyword.casefold(), self.prompt_templates['default'])
+            prompt = self._build_enhanced_prompt(schema, num_rows, template, keyword)
+            
+            try:
+                response = self.ollama.generate(
+                    model=self.model_name,
+                    prompt=prompt,
+                    options={
+                        'num_predict': self.max_tokens,
+                        'temperature': self.temperature,
+                        'top_p': 0.9,
+                        'repeat_penalty': 1.1
+                    }
+                )
+                result = response.get('response', '')
+                if result and len(result.strip()) > 50:
+                    cleaned = self._clean_and_validate_csv(result, schema)
+                    if cleaned:
+                        return cleaned, True
+            except Exception as e:
+                logger.error(f"Ollama generation failed: {e}")
+        
+        # Enhanced fallback generation
+        return self._generate_enhanced_fallback(schema, num_rows, keyword), False
+    
+    def _build_enhanced_prompt(self, schema: Dict, num_rows: int, template: Dict, keyword: str) -> str:
+        
+        columns = schema.get('columns', [])
+        sample_data = schema.get('sample_data', {})
+        
+        schema_key = tuple((col['name'], col['dtype'], str(sample_data.get(col['name'], ''))) for col in columns)
+        skeleton = _render_prompt_skeleton(
+            schema_key, keyword,
+            template['context'], template['quality_requirements'], template['example']
+        )
+        
+        return str(num_rows).join(skeleton)
     
     def _clean_and_validate_csv(self, output: str, schema: Dict) -> str:
         try:
             lines = output.strip().split('\n')
-            csv_lines = []
-            expected_cols = len(schema.get('columns', []))
+            buf = io.StringIO()
+            written = 0
+            expected_commas = len(schema.get('columns', [])) - 1
             
             # Find header line
             header_found = False
             for i, line in enumerate(lines):
-                if ',' in line and len(line.split(',')) == expected_cols:
+                if ',' in line and line.count(',') == expected_commas:
                     # Potential header or data line
                     if not header_found:
                         # First valid line is header
-                        csv_lines.append(line.strip())
+                        buf.write(line.strip())
+                        written += 1
                         header_found = True
                     else:
                         # Data line
                         cleaned_line = self._clean_csv_line(line.strip())
                         if cleaned_line:
-                            csv_lines.append(cleaned_line)
+                            buf.write('\n')
+                            buf.write(cleaned_line)
+                            written += 1
                 
                 # Limit to prevent excessive data
-                if len(csv_lines) > 101:  # Header + 100 rows max
+                if written > 101:  # Header + 100 rows max
                     break
             
-            if len(csv_lines) >= 2:  # At least header + 1 data row
-                return '\n'.join(csv_lines)
+            if written >= 2:  # At least header + 1 data row
+                return buf.getvalue()
             
         except Exception as e:
             logger.error(f"CSV cleaning failed: {e}")
@@ -214,11 +293,12 @@ Generate the CSV data now:"""
     
     def _clean_csv_line(self, line: str) -> str:
         # Remove common artifacts
-        line = re.sub(r'^[^a-zA-Z0-9]', '', line)  # Remove leading non-alphanumeric
-        line = re.sub(r'[^a-zA-Z0-9,.\-_@\s]', '', line)  # Remove special chars except CSV-safe ones
+        if line and line[0] not in _ALNUM:
+            line = line[1:]  # Remove leading non-alphanumeric
+        line = line.translate(_CSV_SAFE)  # Remove special chars except CSV-safe ones
         
         # Ensure proper CSV format
-        if ',' in line and len(line.split(',')) >= 2:
+        if ',' in line:
             return line
         
         return None
@@ -229,113 +309,101 @@ Generate the CSV data now:"""
             return self._generate_basic_fallback(num_rows)
         
         # Create header
-        headers = [col['name'] for col in columns]
-        csv_lines = [','.join(headers)]
+        buf = io.StringIO()
+        writer = csv.writer(buf, lineterminator='\n')
+        writer.writerow([col['name'] for col in columns])
         
         # Domain-specific value generators
         domain_generators = self._get_domain_generators(keyword)
         
-        # Generate data rows
-        for row_num in range(min(num_rows, 100)):
-            row = []
-            for col in columns:
-                col_name = col['name'].lower()
-                col_type = col['dtype'].lower()
-                
-                # Generate value based on column name and type
-                value = self._generate_column_value(col_name, col_type, row_num, domain_generators)
-                row.append(str(value))
-            
-            csv_lines.append(','.join(row))
+        # Pick each column's value generator once, then run them per row.
+        # A Generator per call keeps concurrent variations off a shared RNG state.
+        rows = min(num_rows, 100)
+        rng = np.random.default_rng()
+        col_fns = [self._compile_column(col, domain_generators, rows, rng) for col in columns]
+        writer.writerows([fn(row_num) for fn in col_fns] for row_num in range(rows))
         
-        return '\n'.join(csv_lines)
+        return buf.getvalue().rstrip('\n')
     
     def _get_domain_generators(self, keyword: str) -> Dict:
         keyword = keyword.lower()
         
         if 'health' in keyword or 'medical' in keyword:
-            return {
-                'names': ['John Smith', 'Sarah Johnson', 'Michael Brown', 'Emily Davis', 'David Wilson'],
-                'conditions': ['Hypertension', 'Diabetes', 'Asthma', 'Arthritis', 'Migraine'],
-                'departments': ['Cardiology', 'Neurology', 'Orthopedics', 'Pediatrics', 'Emergency']
-            }
+            return _HEALTH_GENERATORS
         elif 'finance' in keyword or 'bank' in keyword:
-            return {
-                'names': ['Alice Cooper', 'Bob Johnson', 'Carol White', 'David Lee', 'Eva Martinez'],
-                'account_types': ['Checking', 'Savings', 'Credit', 'Investment', 'Loan'],
-                'transaction_types': ['Deposit', 'Withdrawal', 'Transfer', 'Payment', 'Fee']
-            }
+            return _FINANCE_GENERATORS
         elif 'education' in keyword or 'school' in keyword:
-            return {
-                'names': ['Alex Chen', 'Maria Garcia', 'James Kim', 'Lisa Wang', 'Tom Anderson'],
-                'courses': ['Mathematics', 'Science', 'English', 'History', 'Art'],
-                'majors': ['Computer Science', 'Biology', 'Business', 'Psychology', 'Engineering']
-            }
+            return _EDUCATION_GENERATORS
         else:
-            return {
-                'names': ['Person A', 'Person B', 'Person C', 'Person D', 'Person E'],
-                'categories': ['Category 1', 'Category 2', 'Category 3', 'Category 4', 'Category 5'],
-                'statuses': ['Active', 'Inactive', 'Pending', 'Completed', 'Cancelled']
-            }
+            return _DEFAULT_GENERATORS
     
-    def _generate_column_value(self, col_name: str, col_type: str, row_num: int, generators: Dict) -> str:
+    def _compile_column(self, col: Dict, generators: Dict, rows: int, rng: np.random.Generator) -> Callable[[int], str]:
+        """Per-row value generator for one column, classified once; random values for all rows are drawn up front"""
+        col_name = col['name'].lower()
+        col_type = col['dtype'].lower()
+        
         # ID columns
         if 'id' in col_name:
-            return str(1000 + row_num)
+            return lambda row_num: str(1000 + row_num)
         
         # Name columns
         if 'name' in col_name:
-            return random.choice(generators.get('names', ['Sample Name']))
+            picks = rng.choice(generators.get('names', ['Sample Name']), rows).tolist()
+            return picks.__getitem__
         
         # Age columns
         if 'age' in col_name:
-            return str(random.randint(18, 85))
+            return rng.integers(18, 86, rows).astype(str).tolist().__getitem__
         
         # Email columns
         if 'email' in col_name:
-            name = generators.get('names', ['user'])[row_num % len(generators.get('names', ['user']))]
-            domain = random.choice(['gmail.com', 'yahoo.com', 'company.com'])
-            return f"{name.lower().replace(' ', '.')}@{domain}"
+            local_parts = [name.lower().replace(' ', '.') for name in generators.get('names', ['user'])]
+            domains = rng.choice(['gmail.com', 'yahoo.com', 'company.com'], rows).tolist()
+            return lambda row_num: f"{local_parts[row_num % len(local_parts)]}@{domains[row_num]}"
         
         # Date columns
         if 'date' in col_name or 'time' in col_name:
-            return f"2024-{random.randint(1,12):02d}-{random.randint(1,28):02d}"
+            dates = np.char.add(_MONTH_PREFIXES[rng.integers(0, 12, rows)], _DAY_SUFFIXES[rng.integers(0, 28, rows)])
+            return dates.tolist().__getitem__
         
         # Numeric columns
         if 'int' in col_type or 'number' in col_name:
             if 'price' in col_name or 'cost' in col_name or 'amount' in col_name:
-                return f"{random.uniform(10, 1000):.2f}"
+                return np.char.mod('%.2f', rng.uniform(10, 1000, rows)).tolist().__getitem__
             else:
-                return str(random.randint(1, 1000))
+                return rng.integers(1, 1001, rows).astype(str).tolist().__getitem__
         
         if 'float' in col_type:
-            return f"{random.uniform(1, 100):.2f}"
+            return np.char.mod('%.2f', rng.uniform(1, 100, rows)).tolist().__getitem__
         
         # Category/Status columns
         if 'category' in col_name:
-            return random.choice(generators.get('categories', ['Category A']))
+            picks = rng.choice(generators.get('categories', ['Category A']), rows).tolist()
+            return picks.__getitem__
         
         if 'status' in col_name:
-            return random.choice(generators.get('statuses', ['Active']))
+            picks = rng.choice(generators.get('statuses', ['Active']), rows).tolist()
+            return picks.__getitem__
         
         # Default text value
-        return f"{col_name.title()}_{row_num + 1}"
+        title = col_name.title()
+        return lambda row_num: f"{title}_{row_num + 1}"
     
     def _generate_basic_fallback(self, num_rows: int) -> str:
-        headers = ['id', 'name', 'value', 'category', 'status']
-        csv_lines = [','.join(headers)]
+        buf = io.StringIO()
+        writer = csv.writer(buf, lineterminator='\n')
+        writer.writerow(['id', 'name', 'value', 'category', 'status'])
         
-        categories = ['A', 'B', 'C', 'D', 'E']
-        statuses = ['active', 'inactive', 'pending']
+        rows = min(num_rows, 50)
+        rng = np.random.default_rng()
+        ids = range(1, rows + 1)
         
-        for i in range(min(num_rows, 50)):
-            row = [
-                str(i + 1),
-                f"Item_{i + 1}",
-                f"{random.uniform(10, 1000):.2f}",
-                random.choice(categories),
-                random.choice(statuses)
-            ]
-            csv_lines.append(','.join(row))
+        writer.writerows(zip(
+            ids,
+            [f"Item_{i}" for i in ids],
+            np.char.mod('%.2f', rng.uniform(10, 1000, rows)).tolist(),
+            rng.choice(['A', 'B', 'C', 'D', 'E'], rows).tolist(),
+            rng.choice(['active', 'inactive', 'pending'], rows).tolist()
+        ))
         
-        return '\n'.join(csv_lines)
+        return buf.getvalue().rstrip('\n')
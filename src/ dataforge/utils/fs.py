@@ -0,0 +1,16 @@
+from pathlib import Path
+from typing import Set, Union
+
+# Directories already created (or confirmed) by this process. Only use this for
+# startup directories: anything a user may delete while the app runs (per-keyword
+# output, caches, job state) must call mkdir(parents=True, exist_ok=True) directly
+_ENSURED: Set[str] = set()
+
+def ensure_dir(path: Union[str, Path]) -> Path:
+    """Create a directory once per process, skipping the stat/mkdir on repeat calls"""
+    path = Path(path)
+    key = str(path.absolute())
+    if key not in _ENSURED:
+        path.mkdir(parents=True, exist_ok=True)
+        _ENSURED.add(key)
+    return path
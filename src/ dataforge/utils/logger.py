@@ -2,12 +2,25 @@ import logging
 import sys
 from pathlib import Path
 
+from dataforge.utils.fs import ensure_dir
+
+_FORMATTER = logging.Formatter(
+    '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+
+# Handlers reused across setup_logging calls, so repeat calls don't reopen the log file
+_CONSOLE_HANDLER = None
+_FILE_HANDLERS = {}
+
 def setup_logging(config: dict) -> logging.Logger:
+    global _CONSOLE_HANDLER
+    
     log_config = config.get('logging', {})
     log_file = log_config.get('log_file', 'logs/dataforge.log')
     log_level = log_config.get('log_level', 'INFO').upper()
     
-    Path(log_file).parent.mkdir(parents=True, exist_ok=True)
+    ensure_dir(Path(log_file).parent)
     
     logger = logging.getLogger('dataforge')
     logger.setLevel(log_level)
@@ -15,19 +28,19 @@ def setup_logging(config: dict) -> logging.Logger:
     # Clear existing handlers
     logger.handlers.clear()
     
-    formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
-    
     # Console handler
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+    if _CONSOLE_HANDLER is None:
+        _CONSOLE_HANDLER = logging.StreamHandler(sys.stdout)
+        _CONSOLE_HANDLER.setFormatter(_FORMATTER)
+    logger.addHandler(_CONSOLE_HANDLER)
     
-    # File handler
-    file_handler = logging.FileHandler(log_file)
-    file_handler.setFormatter(formatter)
+    # File handler, opened on the first record
+    key = str(Path(log_file).absolute())
+    file_handler = _FILE_HANDLERS.get(key)
+    if file_handler is None:
+        file_handler = logging.FileHandler(log_file, delay=True)
+        file_handler.setFormatter(_FORMATTER)
+        _FILE_HANDLERS[key] = file_handler
     logger.addHandler(file_handler)
     
     return logger